@@ -12,6 +12,9 @@ class Events:
 
     ORDER_FILLED = "order_filled"
     ORDER_CANCELLED = "order_cancelled"
+    ORDER_FAILED = "order_failed"
+    EXCHANGE_DISCONNECTED = "exchange_disconnected"
+    STRATEGY_FAILED = "strategy_failed"
     START_BOT = "start_bot"
     STOP_BOT = "stop_bot"
 
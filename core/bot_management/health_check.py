@@ -11,6 +11,11 @@ from core.bot_management.notification.notification_content import NotificationTy
 from core.bot_management.notification.notification_handler import NotificationHandler
 from utils.constants import RESSOURCE_THRESHOLDS
 
+# (resource, alert label, trend key, threshold) entries, built once since the thresholds are constant
+_RESSOURCE_THRESHOLD_ITEMS: tuple[tuple[str, str, str, float], ...] = tuple(
+    (resource, resource.upper(), f"{resource}_trend", threshold) for resource, threshold in RESSOURCE_THRESHOLDS.items()
+)
+
 
 @dataclass
 class ResourceMetrics:
@@ -26,7 +31,8 @@ class ResourceMetrics:
 
 class HealthCheck:
     """
-    Periodically checks the bot's health and system resource usage and sends alerts if thresholds are exceeded.
+    Periodically checks system resource usage and sends alerts if thresholds are exceeded.
+    The bot's health is checked as soon as an order failure or an exchange disconnection is reported.
     """
 
     def __init__(
@@ -36,6 +42,8 @@ class HealthCheck:
         event_bus: EventBus,
         check_interval: int = 60,
         metrics_history_size: int = 60,  # Keep 1 hour of metrics at 1-minute intervals
+        disk_check_every: int = 4,
+        order_failure_check_interval: float = 30,
     ):
         """
         Initializes the HealthCheck.
@@ -46,6 +54,9 @@ class HealthCheck:
             event_bus: The EventBus instance for listening to bot lifecycle events.
             check_interval: Time interval (in seconds) between health checks.
             metrics_history_size: Number of metrics to keep in the history.
+            disk_check_every: Number of health checks between two disk usage readings.
+            order_failure_check_interval: Minimum time (in seconds) between two bot health checks
+                triggered by order failures.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.bot = bot
@@ -57,9 +68,22 @@ class HealthCheck:
         self.process = psutil.Process()
         self._metrics_history: list[ResourceMetrics] = []
         self.metrics_history_size = metrics_history_size
-        self.process.cpu_percent()  # First call to initialize CPU monitoring
+        self._disk_every = max(1, disk_check_every)
+        self._disk_tick = 0
+        self._disk_cache: float | None = None
+        self.order_failure_check_interval = order_failure_check_interval
+        # Serializes event-driven bot health checks, each of them queries the exchange status
+        self._bot_health_lock = asyncio.Lock()
+        self._last_bot_health_check_at: float | None = None
+        # cpu_percent() compares against the previous call, so these no-op warmup calls
+        # make the first health check return meaningful values without blocking
+        psutil.cpu_percent(interval=None)
+        self.process.cpu_percent(interval=None)
         self.event_bus.subscribe(Events.STOP_BOT, self._handle_stop)
         self.event_bus.subscribe(Events.START_BOT, self._handle_start)
+        self.event_bus.subscribe(Events.ORDER_FAILED, self._handle_order_failed)
+        self.event_bus.subscribe(Events.EXCHANGE_DISCONNECTED, self._handle_exchange_disconnected)
+        self.event_bus.subscribe(Events.STRATEGY_FAILED, self._handle_strategy_failed)
 
     async def start(self):
         """
@@ -73,46 +97,116 @@ class HealthCheck:
         self._stop_event.clear()
         self.logger.info("HealthCheck started.")
 
+        loop = asyncio.get_running_loop()
+        next_check_at = loop.time()
+
         try:
             while self._is_running:
                 await self._perform_checks()
-                stop_task = asyncio.create_task(self._stop_event.wait())
-                done, _ = await asyncio.wait([stop_task], timeout=self.check_interval)
+                # Keep a fixed cadence so the time spent in checks doesn't delay the next one,
+                # without bursting to catch up when a check overran the interval
+                now = loop.time()
+                next_check_at = max(next_check_at + self.check_interval, now)
 
-                if stop_task in done:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=next_check_at - now)
                     # Stop event was triggered; exit loop
                     break
 
+                except TimeoutError:
+                    continue
+
         except asyncio.CancelledError:
             self.logger.info("HealthCheck task cancelled.")
 
         except Exception as e:
-            self.logger.error(f"Unexpected error in HealthCheck: {e}")
+            self.logger.error("Unexpected error in HealthCheck: %s", e)
             await self.notification_handler.async_send_notification(
                 NotificationType.ERROR_OCCURRED,
                 error_details=f"Health check encountered an error: {e}",
             )
 
+        finally:
+            # Event-driven checks only run while the monitoring loop does
+            self._is_running = False
+
     async def _perform_checks(self):
         """
-        Performs bot health and resource usage checks.
+        Performs the periodic resource usage checks.
         """
-        self.logger.info("Starting health checks for bot and system resources.")
+        self.logger.info("Starting health checks for system resources.")
 
-        bot_health = await self.bot.get_bot_health_status()
-        self.logger.info(f"Fetched bot health status: {bot_health}")
-        await self._check_and_alert_bot_health(bot_health)
+        try:
+            # psutil reads /proc and calls statvfs; keep it off the event loop
+            resource_usage = await asyncio.to_thread(self._check_resource_usage)
+            self.logger.info("System resource usage: %s", resource_usage)
+            alerts = self._check_and_alert_resource_usage(resource_usage)
 
-        resource_usage = self._check_resource_usage()
-        self.logger.info(f"System resource usage: {resource_usage}")
-        await self._check_and_alert_resource_usage(resource_usage)
+        except Exception as e:
+            # Report the failure and keep monitoring on the next tick
+            self.logger.error("Failed to check system resource usage: %s", e, exc_info=True)
+            alerts = [f"Failed to check system resource usage: {e}"]
+
+        if alerts:
+            await self._send_alert(alerts)
 
-    async def _check_and_alert_bot_health(self, health_status: dict):
+    async def _check_bot_health(self, alerts: list[str]) -> None:
         """
-        Checks the bot's health status and sends alerts if necessary.
+        Fetches the bot's health status and sends its alerts along with the given ones.
+
+        Args:
+            alerts: Alerts already raised by the event that triggered the check.
+        """
+        async with self._bot_health_lock:
+            self._last_bot_health_check_at = asyncio.get_running_loop().time()
+
+            try:
+                bot_health = await self.bot.get_bot_health_status()
+                self.logger.info("Fetched bot health status: %s", bot_health)
+                alerts = alerts + self._check_and_alert_bot_health(bot_health)
+
+            except Exception as e:
+                # Still send the alerts raised by the triggering event
+                self.logger.error("Failed to fetch bot health status: %s", e, exc_info=True)
+                alerts = [*alerts, f"Failed to fetch bot health status: {e}"]
+
+            if alerts:
+                await self._send_alert(alerts)
+
+    def _bot_health_checked_recently(self) -> bool:
+        """
+        Returns whether a bot health check is in flight or ran less than `order_failure_check_interval` ago.
+        """
+        if self._bot_health_lock.locked():
+            return True
+
+        if self._last_bot_health_check_at is None:
+            return False
+
+        elapsed = asyncio.get_running_loop().time() - self._last_bot_health_check_at
+        return elapsed < self.order_failure_check_interval
+
+    async def _send_alert(self, alerts: list[str]) -> None:
+        """
+        Sends all alerts raised during a health check as a single notification.
+
+        Args:
+            alerts: The alert messages to send.
+        """
+        await self.notification_handler.async_send_notification(
+            NotificationType.HEALTH_CHECK_ALERT,
+            alert_details=" | ".join(alerts),
+        )
+
+    def _check_and_alert_bot_health(self, health_status: dict) -> list[str]:
+        """
+        Checks the bot's health status and collects alerts if necessary.
 
         Args:
             health_status: A dictionary containing the bot's health status.
+
+        Returns:
+            The list of bot health alert messages, empty if the bot is healthy.
         """
         alerts = []
 
@@ -120,19 +214,18 @@ class HealthCheck:
             alerts.append("Trading strategy has encountered issues.")
             self.logger.warning("Trading strategy is not functioning properly.")
 
-        if health_status["exchange_status"] != "ok":
-            alerts.append(f"Exchange status is not ok: {health_status['exchange_status']}")
-            self.logger.warning(f"Exchange status issue detected: {health_status['exchange_status']}")
+        exchange_status = health_status["exchange_status"]
+        if exchange_status != "ok":
+            alerts.append(f"Exchange status is not ok: {exchange_status}")
+            self.logger.warning("Exchange status issue detected: %s", exchange_status)
 
         if alerts:
-            self.logger.info(f"Bot health alerts generated: {alerts}")
-            await self.notification_handler.async_send_notification(
-                NotificationType.HEALTH_CHECK_ALERT,
-                alert_details=" | ".join(alerts),
-            )
+            self.logger.info("Bot health alerts generated: %s", alerts)
         else:
             self.logger.info("Bot health is within acceptable parameters.")
 
+        return alerts
+
     def _check_resource_usage(self) -> dict:
         """
         Collects detailed system and bot resource usage metrics.
@@ -141,22 +234,23 @@ class HealthCheck:
             Dictionary containing various resource metrics.
         """
         # Get system-wide metrics
-        cpu_percent = psutil.cpu_percent(interval=1)  # 1 second interval for accurate measurement
+        cpu_percent = psutil.cpu_percent(interval=None)  # Usage since the previous check
         virtual_memory = psutil.virtual_memory()
-        disk = psutil.disk_usage("/")
+        disk_percent = self._get_disk_percent()
 
-        # Get process-specific metrics
+        # Get process-specific metrics, reusing the cached process handle so /proc is read once per tick
         try:
-            bot_memory_info = self.process.memory_info()
-            bot_cpu_percent = self.process.cpu_percent()
-            open_files = len(self.process.open_files())
-            thread_count = self.process.num_threads()
+            with self.process.oneshot():
+                bot_memory_info = self.process.memory_info()
+                bot_cpu_percent = self.process.cpu_percent()
+                open_files = len(self.process.open_files())
+                thread_count = self.process.num_threads()
 
             metrics = ResourceMetrics(
-                timestamp=datetime.now(tz=timezome.utc),
+                timestamp=datetime.now(tz=timezone.utc),
                 cpu_percent=cpu_percent,
                 memory_percent=virtual_memory.percent,
-                disk_percent=disk.percent,
+                disk_percent=disk_percent,
                 bot_cpu_percent=bot_cpu_percent,
                 bot_memory_mb=bot_memory_info.rss / (1024 * 1024),  # Convert to MB
                 open_files=open_files,
@@ -171,7 +265,7 @@ class HealthCheck:
             return {
                 "cpu": cpu_percent,
                 "memory": virtual_memory.percent,
-                "disk": disk.percent,
+                "disk": disk_percent,
                 "bot_cpu": bot_cpu_percent,
                 "bot_memory_mb": bot_memory_info.rss / (1024 * 1024),
                 "bot_memory_percent": (bot_memory_info.rss / virtual_memory.total) * 100,
@@ -181,14 +275,27 @@ class HealthCheck:
             }
 
         except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-            self.logger.error(f"Failed to get process metrics: {e}")
+            self.logger.error("Failed to get process metrics: %s", e)
             return {
                 "cpu": cpu_percent,
                 "memory": virtual_memory.percent,
-                "disk": disk.percent,
+                "disk": disk_percent,
                 "error": str(e),
             }
 
+    def _get_disk_percent(self) -> float:
+        """
+        Returns the disk usage percentage, only querying the filesystem every `disk_check_every` checks.
+
+        Returns:
+            The latest disk usage percentage.
+        """
+        if self._disk_cache is None or self._disk_tick % self._disk_every == 0:
+            self._disk_cache = psutil.disk_usage("/").percent
+
+        self._disk_tick += 1
+        return self._disk_cache
+
     def get_resource_trends(self) -> dict[str, float]:
         """
         Calculate resource usage trends over the stored history.
@@ -213,22 +320,27 @@ class HealthCheck:
             "bot_memory_trend": (recent.bot_memory_mb - old.bot_memory_mb) / time_diff,
         }
 
-    async def _check_and_alert_resource_usage(self, usage: dict):
+    def _check_and_alert_resource_usage(self, usage: dict) -> list[str]:
         """
         Enhanced resource monitoring with trend analysis and detailed alerts.
+
+        Args:
+            usage: A dictionary containing the current resource usage.
+
+        Returns:
+            The list of resource alert messages, empty if all resources are within thresholds.
         """
         alerts = []
         trends = self.get_resource_trends()
 
         # Check current values against thresholds
-        for resource, threshold in RESSOURCE_THRESHOLDS.items():
+        for resource, label, trend_key, threshold in _RESSOURCE_THRESHOLD_ITEMS:
             current_value = usage.get(resource, 0)
             if current_value > threshold:
-                trend = trends.get(f"{resource}_trend", 0)
+                trend = trends.get(trend_key, 0)
                 trend_direction = "increasing" if trend > 1 else "decreasing" if trend < -1 else "stable"
                 message = (
-                    f"{resource.upper()} usage is high: {current_value:.1f}% "
-                    f"(Threshold: {threshold}%, Trend: {trend_direction})"
+                    f"{label} usage is high: {current_value:.1f}% (Threshold: {threshold}%, Trend: {trend_direction})"
                 )
                 alerts.append(message)
 
@@ -237,11 +349,9 @@ class HealthCheck:
             alerts.append(f"High CPU usage trend: Bot CPU usage increasing by {trends['bot_cpu_trend']:.1f}%/hour")
 
         if alerts:
-            self.logger.warning(f"Resource alerts: {alerts}")
-            await self.notification_handler.async_send_notification(
-                NotificationType.HEALTH_CHECK_ALERT,
-                alert_details=" | ".join(alerts),
-            )
+            self.logger.warning("Resource alerts: %s", alerts)
+
+        return alerts
 
     def _handle_stop(self, reason: str) -> None:
         """
@@ -256,7 +366,55 @@ class HealthCheck:
 
         self._is_running = False
         self._stop_event.set()
-        self.logger.info(f"HealthCheck stopped: {reason}")
+        self.logger.info("HealthCheck stopped: %s", reason)
+
+    async def _handle_order_failed(self, error_details: str) -> None:
+        """
+        Handles the ORDER_FAILED event by checking the bot's health right away.
+        The order failure itself is already notified by the OrderManager, so failures reported
+        while a bot health check is in flight or was just performed are not checked again, as
+        an outage typically fails every grid order at once.
+
+        Args:
+            error_details: Details about the failed order.
+        """
+        if not self._is_running:
+            return
+
+        if self._bot_health_checked_recently():
+            self.logger.info("Order failure reported, bot health was just checked: %s", error_details)
+            return
+
+        self.logger.warning("Order failure reported, checking bot health: %s", error_details)
+        await self._check_bot_health([])
+
+    async def _handle_exchange_disconnected(self, reason: str) -> None:
+        """
+        Handles the EXCHANGE_DISCONNECTED event by alerting and checking the bot's health right away.
+        Unlike order failures, a disconnection is never skipped since it carries its own alert.
+
+        Args:
+            reason: The reason for the disconnection.
+        """
+        if not self._is_running:
+            return
+
+        self.logger.warning("Exchange disconnection reported: %s", reason)
+        await self._check_bot_health([f"Exchange disconnected: {reason}"])
+
+    async def _handle_strategy_failed(self, error_details: str) -> None:
+        """
+        Handles the STRATEGY_FAILED event by alerting and checking the bot's health right away.
+        The trading loop has exited on an unexpected error, so this is never skipped either.
+
+        Args:
+            error_details: Details about the error that stopped the strategy.
+        """
+        if not self._is_running:
+            return
+
+        self.logger.error("Trading strategy failure reported: %s", error_details)
+        await self._check_bot_health([f"Trading strategy stopped unexpectedly: {error_details}"])
 
     async def _handle_start(self, reason: str) -> None:
         """
@@ -269,5 +427,5 @@ class HealthCheck:
             self.logger.warning("HealthCheck is already running.")
             return
 
-        self.logger.info(f"HealthCheck starting: {reason}")
+        self.logger.info("HealthCheck starting: %s", reason)
         await self.start()
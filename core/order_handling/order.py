@@ -1,6 +1,10 @@
+from datetime import datetime, timezone
 from enum import Enum
 
-import pandas as pd
+_ORDER_STR_TEMPLATE = (
+    "Order(id=%s, status=%s, type=%s, side=%s, price=%s, average=%s, amount=%s, filled=%s, remaining=%s, "
+    "timestamp=%s, datetime=%s, symbol=%s, time_in_force=%s, trades=%s, fee=%s, cost=%s)"
+)
 
 
 class OrderSide(Enum):
@@ -23,6 +27,27 @@ class OrderStatus(Enum):
 
 
 class Order:
+    __slots__ = (
+        "amount",
+        "average",
+        "cost",
+        "datetime",
+        "fee",
+        "filled",
+        "identifier",
+        "info",
+        "last_trade_timestamp",
+        "order_type",
+        "price",
+        "remaining",
+        "side",
+        "status",
+        "symbol",
+        "time_in_force",
+        "timestamp",
+        "trades",
+    )
+
     def __init__(
         self,
         identifier: str,
@@ -64,26 +89,37 @@ class Order:
         self.info = info  # Original unparsed structure for debugging or auditing
 
     def is_filled(self) -> bool:
-        return self.status == OrderStatus.CLOSED
+        return self.status is OrderStatus.CLOSED
 
     def is_canceled(self) -> bool:
-        return self.status == OrderStatus.CANCELED
+        return self.status is OrderStatus.CANCELED
 
     def is_open(self) -> bool:
-        return self.status == OrderStatus.OPEN
+        return self.status is OrderStatus.OPEN
 
     def format_last_trade_timestamp(self) -> str | None:
         if self.last_trade_timestamp is None:
             return None
-        return pd.Timestamp(self.last_trade_timestamp, unit="s").isoformat()
+        return datetime.fromtimestamp(self.last_trade_timestamp, tz=timezone.utc).replace(tzinfo=None).isoformat()
 
     def __str__(self) -> str:
-        return (
-            f"Order(id={self.identifier}, status={self.status}, "
-            f"type={self.order_type}, side={self.side}, price={self.price}, average={self.average}, "
-            f"amount={self.amount}, filled={self.filled}, remaining={self.remaining}, "
-            f"timestamp={self.timestamp}, datetime={self.datetime}, symbol={self.symbol}, "
-            f"time_in_force={self.time_in_force}, trades={self.trades}, fee={self.fee}, cost={self.cost})"
+        return _ORDER_STR_TEMPLATE % (
+            self.identifier,
+            self.status,
+            self.order_type,
+            self.side,
+            self.price,
+            self.average,
+            self.amount,
+            self.filled,
+            self.remaining,
+            self.timestamp,
+            self.datetime,
+            self.symbol,
+            self.time_in_force,
+            self.trades,
+            self.fee,
+            self.cost,
         )
 
     def __repr__(self) -> str:
@@ -94,10 +94,12 @@ class OrderManager:
 
                 except OrderExecutionFailedError as e:
                     self.logger.error(f"Failed to initialize buy order at grid level {price} - {e!s}", exc_info=True)
+                    error_details = f"Error while placing initial buy order. {e}"
                     await self.notification_handler.async_send_notification(
                         NotificationType.ORDER_FAILED,
-                        error_details=f"Error while placing initial buy order. {e}",
+                        error_details=error_details,
                     )
+                    await self.event_bus.publish(Events.ORDER_FAILED, error_details)
 
                 except Exception as e:
                     self.logger.error(
@@ -148,10 +150,12 @@ class OrderManager:
 
                 except OrderExecutionFailedError as e:
                     self.logger.error(f"Failed to initialize sell order at grid level {price} - {e!s}", exc_info=True)
+                    error_details = f"Error while placing initial sell order. {e}"
                     await self.notification_handler.async_send_notification(
                         NotificationType.ORDER_FAILED,
-                        error_details=f"Error while placing initial sell order. {e}",
+                        error_details=error_details,
                     )
+                    await self.event_bus.publish(Events.ORDER_FAILED, error_details)
 
                 except Exception as e:
                     self.logger.error(
@@ -202,10 +206,12 @@ class OrderManager:
 
         except OrderExecutionFailedError as e:
             self.logger.error(f"Failed while handling filled order - {e!s}", exc_info=True)
+            error_details = f"Failed handling filled order. {e}"
             await self.notification_handler.async_send_notification(
                 NotificationType.ORDER_FAILED,
-                error_details=f"Failed handling filled order. {e}",
+                error_details=error_details,
             )
+            await self.event_bus.publish(Events.ORDER_FAILED, error_details)
 
         except Exception as e:
             self.logger.error(f"Error while handling filled order {order.identifier}: {e}", exc_info=True)
@@ -403,7 +409,7 @@ class OrderManager:
                 initial_quantity,
                 current_price,
             )
-            self.logger.info(f"Initial crypto purchase completed. Order details: {buy_order}")
+            self.logger.info("Initial crypto purchase completed. Order details: %s", buy_order)
             self.order_book.add_order(buy_order)
             await self.notification_handler.async_send_notification(
                 NotificationType.ORDER_PLACED,
@@ -418,10 +424,12 @@ class OrderManager:
 
         except OrderExecutionFailedError as e:
             self.logger.error(f"Failed while executing initial purchase - {e!s}", exc_info=True)
+            error_details = f"Error while performing initial purchase. {e}"
             await self.notification_handler.async_send_notification(
                 NotificationType.ORDER_FAILED,
-                error_details=f"Error while performing initial purchase. {e}",
+                error_details=error_details,
             )
+            await self.event_bus.publish(Events.ORDER_FAILED, error_details)
 
         except Exception as e:
             self.logger.error(
@@ -478,10 +486,12 @@ class OrderManager:
 
         except OrderExecutionFailedError as e:
             self.logger.error(f"Order execution failed: {e!s}")
+            error_details = f"Failed to place {event} order: {e}"
             await self.notification_handler.async_send_notification(
                 NotificationType.ORDER_FAILED,
-                error_details=f"Failed to place {event} order: {e}",
+                error_details=error_details,
             )
+            await self.event_bus.publish(Events.ORDER_FAILED, error_details)
 
         except Exception as e:
             self.logger.error(f"Failed to execute {event} sell order at {current_price}: {e}")
@@ -110,7 +110,7 @@ class OrderStatusTracker:
                         f"Remaining: {remote_order.remaining}.",
                     )
                 else:
-                    self.logger.info(f"Order {remote_order} is still open. No fills yet.")
+                    self.logger.info("Order %s is still open. No fills yet.", remote_order)
             else:
                 self.logger.warning(
                     f"Unhandled order status '{remote_order.status}' for order {remote_order.identifier}.",
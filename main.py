@@ -20,6 +20,11 @@ from utils.config_name_generator import generate_config_name
 from utils.logging_config import setup_logging
 from utils.performance_results_saver import save_or_append_performance_results
 
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional speedup and isn't available on Windows
+    uvloop = None
+
 
 def initialize_config(config_path: str) -> ConfigManager:
     load_dotenv()
@@ -139,4 +144,7 @@ if __name__ == "__main__":
             await cleanup_tasks()
             logging.info("All tasks have completed.")
 
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
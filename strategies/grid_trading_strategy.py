@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import numpy as np
@@ -9,6 +10,7 @@ from core.bot_management.event_bus import EventBus, Events
 from core.grid_management.grid_manager import GridManager
 from core.order_handling.balance_tracker import BalanceTracker
 from core.order_handling.order_manager import OrderManager
+from core.services.exceptions import DataFetchError
 from core.services.exchange_interface import ExchangeInterface
 from strategies.plotter import Plotter
 from strategies.trading_performance_analyzer import TradingPerformanceAnalyzer
@@ -171,8 +173,18 @@ class GridTradingStrategy(TradingStrategyInterface):
                 self.TICKER_REFRESH_INTERVAL,
             )
 
-        except Exception as e:
+            # The exchange service swallows cancellation on shutdown, so a cancelled task also returns normally here
+            current_task = asyncio.current_task()
+            if self._running and not (current_task and current_task.cancelling()):
+                await self.event_bus.publish(Events.EXCHANGE_DISCONNECTED, "Ticker updates stopped unexpectedly.")
+
+        except (DataFetchError, ConnectionError, TimeoutError) as e:
             self.logger.error(f"Error in live/paper trading loop: {e}", exc_info=True)
+            await self.event_bus.publish(Events.EXCHANGE_DISCONNECTED, f"Error in live/paper trading loop: {e}")
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error in live/paper trading loop: {e}", exc_info=True)
+            await self.event_bus.publish(Events.STRATEGY_FAILED, f"Unexpected error in live/paper trading loop: {e}")
 
         finally:
             self.logger.info("Exiting live/paper trading loop.")
@@ -290,8 +302,9 @@ class GridTradingStrategy(TradingStrategyInterface):
 
             live_data = pd.DataFrame(self.live_trading_metrics, columns=["timestamp", "account_value", "price"])
             live_data.set_index("timestamp", inplace=True)
-            initial_price = live_data.iloc[0]["price"]
-            final_price = live_data.iloc[-1]["price"]
+            prices = live_data["price"].to_numpy(copy=False)
+            initial_price = prices[0]
+            final_price = prices[-1]
 
             return self.trading_performance_analyzer.generate_performance_summary(
                 live_data,
@@ -1,4 +1,6 @@
+from collections import deque
 import logging
+import math
 from typing import Any
 
 import numpy as np
@@ -11,6 +13,16 @@ from core.order_handling.order import Order
 from core.order_handling.order_book import OrderBook
 
 ANNUAL_RISK_FREE_RATE = 0.03  # annual risk free rate 3%
+TRADING_DAYS_PER_YEAR = 252
+DAILY_RISK_FREE_RATE = ANNUAL_RISK_FREE_RATE / TRADING_DAYS_PER_YEAR
+ANNUALIZATION_FACTOR = math.sqrt(TRADING_DAYS_PER_YEAR)
+# Machine-readable summary entries, returned to callers but left out of the logged summary table
+RAW_SUMMARY_KEYS = frozenset({"ROI_raw"})
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """Sample standard deviation (ddof=1), NaN for fewer than two values as with `pd.Series.std`."""
+    return float(values.std(ddof=1)) if values.size > 1 else float("nan")
 
 
 class TradingPerformanceAnalyzer:
@@ -54,45 +66,121 @@ class TradingPerformanceAnalyzer:
         roi = (final_balance - initial_balance) / initial_balance * 100
         return round(roi, 2)
 
-    def _calculate_trading_gains(self) -> str:
+    def _get_filled_orders(self) -> tuple[list[Order], list[Order]]:
+        """
+        Retrieve the filled buy and sell orders from the order book.
+
+        Returns:
+            Tuple[List[Order], List[Order]]: Filled buy orders and filled sell orders.
+        """
+        filled_buy_orders = [order for order in self.order_book.get_all_buy_orders() if order.is_filled()]
+        filled_sell_orders = [order for order in self.order_book.get_all_sell_orders() if order.is_filled()]
+        return filled_buy_orders, filled_sell_orders
+
+    def _calculate_trading_gains(self, filled_orders: tuple[list[Order], list[Order]] | None = None) -> str:
         """
         Calculates the total trading gains from completed buy and sell orders.
 
         The computation uses only closed orders to determine the net profit or loss
         from executed trades.
 
+        Args:
+            filled_orders (Optional[Tuple[List[Order], List[Order]]]): Filled buy and sell orders
+                already retrieved by the caller. Fetched from the order book when omitted.
+
         Returns:
             str: The total grid trading gains as a formatted string, or "N/A" if there are no sell orders.
         """
-        total_buy_cost = 0.0
-        total_sell_revenue = 0.0
-        closed_buy_orders = [order for order in self.order_book.get_all_buy_orders() if order.is_filled()]
-        closed_sell_orders = [order for order in self.order_book.get_all_sell_orders() if order.is_filled()]
-
-        for buy_order in closed_buy_orders:
-            trade_value = buy_order.amount * buy_order.price
-            buy_fee = buy_order.fee.get("cost", 0.0) if buy_order.fee else 0.0
-            total_buy_cost += trade_value + buy_fee
+        closed_buy_orders, closed_sell_orders = filled_orders or self._get_filled_orders()
 
-        for sell_order in closed_sell_orders:
-            trade_value = sell_order.amount * sell_order.price
-            sell_fee = sell_order.fee.get("cost", 0.0) if sell_order.fee else 0.0
-            total_sell_revenue += trade_value - sell_fee
+        buy_trade_value, buy_fees = self._sum_trade_values_and_fees(closed_buy_orders)
+        sell_trade_value, sell_fees = self._sum_trade_values_and_fees(closed_sell_orders)
+        total_buy_cost = buy_trade_value + buy_fees
+        total_sell_revenue = sell_trade_value - sell_fees
 
         return "N/A" if total_sell_revenue == 0 else f"{total_sell_revenue - total_buy_cost:.2f}"
 
-    def _calculate_drawdown(self, data: pd.DataFrame) -> float:
-        peak = data["account_value"].expanding(min_periods=1).max()
-        drawdown = (peak - data["account_value"]) / peak * 100
-        max_drawdown = drawdown.max()
+    def _sum_trade_values_and_fees(self, orders: list[Order]) -> tuple[float, float]:
+        """
+        Sum the traded value (amount * price) and the fee cost of the given orders.
+
+        Args:
+            orders (List[Order]): The orders to aggregate.
+
+        Returns:
+            Tuple[float, float]: The total traded value and the total fee cost.
+        """
+        count = len(orders)
+        amounts = np.fromiter((order.amount for order in orders), dtype=np.float64, count=count)
+        prices = np.fromiter((order.price for order in orders), dtype=np.float64, count=count)
+        fees = np.fromiter(
+            (order.fee.get("cost", 0.0) if order.fee else 0.0 for order in orders),
+            dtype=np.float64,
+            count=count,
+        )
+        return float(amounts @ prices), float(fees.sum())
+
+    def _calculate_drawdown(self, data: pd.DataFrame, lookback: int | None = None) -> float:
+        """
+        Calculate the maximum drawdown of the account value.
+
+        Args:
+            data (pd.DataFrame): Historical account value data.
+            lookback (Optional[int]): Number of periods the running peak is taken over. When omitted the
+                peak spans the whole history.
+
+        Returns:
+            float: The maximum drawdown percentage.
+        """
+        if lookback is None:
+            max_drawdown, _ = self._calculate_drawdown_and_runup(data)
+            return max_drawdown
+
+        if lookback < 1:
+            raise ValueError(f"Drawdown lookback must be at least one period, got {lookback}.")
+
+        # Monotonic deque of (index, value) pairs: the front is the peak of the current lookback window
+        window_peaks: deque[tuple[int, float]] = deque()
+        max_drawdown = 0.0
+
+        for index, value in enumerate(data["account_value"].to_numpy(dtype=np.float64, copy=False).tolist()):
+            if math.isnan(value):
+                continue
+
+            while window_peaks and window_peaks[-1][1] <= value:
+                window_peaks.pop()
+            window_peaks.append((index, value))
+
+            while window_peaks[0][0] <= index - lookback:
+                window_peaks.popleft()
+
+            peak = window_peaks[0][1]
+            max_drawdown = max(max_drawdown, (peak - value) / peak * 100)
+
         return max_drawdown
 
     def _calculate_runup(self, data: pd.DataFrame) -> float:
-        trough = data["account_value"].expanding(min_periods=1).min()
-        runup = (data["account_value"] - trough) / trough * 100
-        max_runup = runup.max()
+        _, max_runup = self._calculate_drawdown_and_runup(data)
         return max_runup
 
+    def _calculate_drawdown_and_runup(self, data: pd.DataFrame) -> tuple[float, float]:
+        """
+        Calculate the maximum drawdown and maximum runup from a single read of the account values.
+
+        Args:
+            data (pd.DataFrame): Historical account value data.
+
+        Returns:
+            Tuple[float, float]: The maximum drawdown and maximum runup percentages.
+        """
+        account_value = data["account_value"].to_numpy(dtype=np.float64, copy=False)
+        # fmax/fmin skip NaN account values, so the running peak/trough carries over unfilled rows
+        peak = np.fmax.accumulate(account_value)
+        trough = np.fmin.accumulate(account_value)
+        max_drawdown = np.nanmax((peak - account_value) / peak * 100)
+        max_runup = np.nanmax((account_value - trough) / trough * 100)
+        return float(max_drawdown), float(max_runup)
+
     def _calculate_time_in_profit_loss(
         self,
         initial_balance: float,
@@ -102,43 +190,65 @@ class TradingPerformanceAnalyzer:
         time_in_loss = (data["account_value"] <= initial_balance).mean() * 100
         return time_in_profit, time_in_loss
 
-    def _calculate_sharpe_ratio(self, data: pd.DataFrame) -> float:
+    def _calculate_excess_returns(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Calculate the per-period account value returns in excess of the daily risk free rate.
+
+        Args:
+            data (pd.DataFrame): Historical account value data.
+
+        Returns:
+            np.ndarray: The excess returns, without the periods missing an account value.
+        """
+        account_value = data["account_value"].to_numpy(dtype=np.float64, copy=False)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            excess_returns = account_value[1:] / account_value[:-1] - 1 - DAILY_RISK_FREE_RATE
+        return excess_returns[~np.isnan(excess_returns)]
+
+    def _calculate_sharpe_ratio(self, data: pd.DataFrame, excess_returns: np.ndarray | None = None) -> float:
         """
         Calculate the Sharpe ratio based on the account value.
 
         Args:
             data (pd.DataFrame): Historical account value data.
+            excess_returns (Optional[np.ndarray]): Precomputed excess returns of `data`, computed when omitted.
 
         Returns:
             float: The Sharpe ratio.
         """
-        returns = data["account_value"].pct_change(fill_method=None)
-        excess_returns = returns - ANNUAL_RISK_FREE_RATE / 252  # Adjusted daily
-        std_dev = excess_returns.std()
-        if std_dev == 0:
-            return 0.0
-        sharpe_ratio = excess_returns.mean() / std_dev * np.sqrt(252)
-        return round(sharpe_ratio, 2)
-
-    def _calculate_sortino_ratio(self, data: pd.DataFrame) -> float:
+        if excess_returns is None:
+            excess_returns = self._calculate_excess_returns(data)
+        if excess_returns.size < 2:
+            return float("nan")  # Sample std needs at least two returns
+        if excess_returns.max() == excess_returns.min():
+            return 0.0  # Flat returns have no volatility
+        sharpe_ratio = excess_returns.mean() / excess_returns.std(ddof=1) * ANNUALIZATION_FACTOR
+        return round(float(sharpe_ratio), 2)
+
+    def _calculate_sortino_ratio(self, data: pd.DataFrame, excess_returns: np.ndarray | None = None) -> float:
         """
         Calculate the Sortino ratio based on the account value.
 
         Args:
             data (pd.DataFrame): Historical account value data.
+            excess_returns (Optional[np.ndarray]): Precomputed excess returns of `data`, computed when omitted.
 
         Returns:
             float: The Sortino ratio.
         """
-        returns = data["account_value"].pct_change(fill_method=None)
-        excess_returns = returns - ANNUAL_RISK_FREE_RATE / 252  # Adjusted daily
+        if excess_returns is None:
+            excess_returns = self._calculate_excess_returns(data)
+        if not excess_returns.size:
+            return float("nan")  # Not enough account values to compute returns
+        mean_excess_return = excess_returns.mean()
         downside_returns = excess_returns[excess_returns < 0]
+        downside_std = _sample_std(downside_returns) if downside_returns.size else 0.0
 
-        if len(downside_returns) == 0 or downside_returns.std() == 0:
-            return round(excess_returns.mean() * np.sqrt(252), 2)  # Positive ratio if no downside
+        if downside_std == 0:
+            return round(float(mean_excess_return * ANNUALIZATION_FACTOR), 2)  # Positive ratio if no downside
 
-        sortino_ratio = excess_returns.mean() / downside_returns.std() * np.sqrt(252)
-        return round(sortino_ratio, 2)
+        sortino_ratio = mean_excess_return / downside_std * ANNUALIZATION_FACTOR
+        return round(float(sortino_ratio), 2)
 
     def get_formatted_orders(self) -> list[list[str | float]]:
         """
@@ -148,30 +258,62 @@ class TradingPerformanceAnalyzer:
             List[List[Union[str, float]]]: Formatted orders with details like side, type,
             status, price, quantity, timestamp, etc.
         """
-        orders = []
-        buy_orders_with_grid = self.order_book.get_buy_orders_with_grid()
-        sell_orders_with_grid = self.order_book.get_sell_orders_with_grid()
-
-        for buy_order, grid_level in buy_orders_with_grid:
-            if buy_order.is_filled():
-                orders.append(self._format_order(buy_order, grid_level))
+        filled_orders_with_grid = [
+            (order, grid_level)
+            for orders_with_grid in (
+                self.order_book.get_buy_orders_with_grid(),
+                self.order_book.get_sell_orders_with_grid(),
+            )
+            for order, grid_level in orders_with_grid
+            if order.is_filled()
+        ]
+        if not filled_orders_with_grid:
+            return []
 
-        for sell_order, grid_level in sell_orders_with_grid:
-            if sell_order.is_filled():
-                orders.append(self._format_order(sell_order, grid_level))
+        slippages = self._calculate_slippages(filled_orders_with_grid)
+        orders = [
+            self._format_order(order, grid_level, slippage)
+            for (order, grid_level), slippage in zip(filled_orders_with_grid, slippages, strict=True)
+        ]
 
         orders.sort(key=lambda x: (x[5] is None, x[5]))  # x[5] is the timestamp, sort None to the end
         return orders
 
-    def _format_order(self, order: Order, grid_level: GridLevel | None) -> list[str | float]:
+    def _calculate_slippages(self, orders_with_grid: list[tuple[Order, GridLevel | None]]) -> list[str]:
+        """
+        Calculate the slippage of each order's average fill price against its grid level price.
+
+        Args:
+            orders_with_grid (List[Tuple[Order, Optional[GridLevel]]]): Orders paired with their grid level.
+
+        Returns:
+            List[str]: The formatted slippage percentage per order, or "N/A" for orders without
+            a grid level or an average fill price.
+        """
+        # Assuming order.average is the execution price and grid level price the expected price
+        has_slippage = [grid_level is not None and order.average is not None for order, grid_level in orders_with_grid]
+        count = len(orders_with_grid)
+        averages = np.fromiter(
+            (
+                order.average if known else np.nan
+                for (order, _), known in zip(orders_with_grid, has_slippage, strict=True)
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+        grid_prices = np.fromiter(
+            (
+                grid_level.price if known else np.nan
+                for (_, grid_level), known in zip(orders_with_grid, has_slippage, strict=True)
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+        slippages = (averages - grid_prices) / grid_prices * 100
+        return [f"{slippage:.2f}%" if known else "N/A" for slippage, known in zip(slippages, has_slippage, strict=True)]
+
+    def _format_order(self, order: Order, grid_level: GridLevel | None, slippage_str: str) -> list[str | float]:
         grid_level_price = grid_level.price if grid_level else "N/A"
-        if grid_level and order.average is not None:
-            # Assuming order.price is the execution price and grid level price the expected price
-            slippage = ((order.average - grid_level_price) / grid_level_price) * 100
-            slippage_str = f"{slippage:.2f}%"
-        else:
-            slippage = "N/A"
-            slippage_str = "N/A"
         return [
             order.side.name,
             order.order_type.name,
@@ -183,16 +325,19 @@ class TradingPerformanceAnalyzer:
             slippage_str,
         ]
 
-    def _calculate_trade_counts(self) -> tuple[int, int]:
+    def _calculate_trade_counts(self, filled_orders: tuple[list[Order], list[Order]] | None = None) -> tuple[int, int]:
         """
         Count the number of filled buy and sell orders.
 
+        Args:
+            filled_orders (Optional[Tuple[List[Order], List[Order]]]): Filled buy and sell orders
+                already retrieved by the caller. Fetched from the order book when omitted.
+
         Returns:
             Tuple[int, int]: Number of buy trades and number of sell trades.
         """
-        num_buy_trades = len([order for order in self.order_book.get_all_buy_orders() if order.is_filled()])
-        num_sell_trades = len([order for order in self.order_book.get_all_sell_orders() if order.is_filled()])
-        return num_buy_trades, num_sell_trades
+        filled_buy_orders, filled_sell_orders = filled_orders or self._get_filled_orders()
+        return len(filled_buy_orders), len(filled_sell_orders)
 
     def _calculate_buy_and_hold_return(
         self,
@@ -239,19 +384,20 @@ class TradingPerformanceAnalyzer:
         pair = f"{self.base_currency}/{self.quote_currency}"
         start_date = data.index[0]
         end_date = data.index[-1]
-        initial_balance = data["account_value"].iloc[0]
+        initial_balance = data["account_value"].to_numpy(copy=False)[0]
         duration = end_date - start_date
         final_crypto_value = final_crypto_balance * final_crypto_price
         final_balance = final_fiat_balance + final_crypto_value
         roi = self._calculate_roi(initial_balance, final_balance)
-        grid_trading_gains = self._calculate_trading_gains()
-        max_drawdown = self._calculate_drawdown(data)
-        max_runup = self._calculate_runup(data)
+        filled_orders = self._get_filled_orders()
+        grid_trading_gains = self._calculate_trading_gains(filled_orders)
+        max_drawdown, max_runup = self._calculate_drawdown_and_runup(data)
         time_in_profit, time_in_loss = self._calculate_time_in_profit_loss(initial_balance, data)
-        sharpe_ratio = self._calculate_sharpe_ratio(data)
-        sortino_ratio = self._calculate_sortino_ratio(data)
+        excess_returns = self._calculate_excess_returns(data)
+        sharpe_ratio = self._calculate_sharpe_ratio(data, excess_returns)
+        sortino_ratio = self._calculate_sortino_ratio(data, excess_returns)
         buy_and_hold_return = self._calculate_buy_and_hold_return(data, initial_price, final_crypto_price)
-        num_buy_trades, num_sell_trades = self._calculate_trade_counts()
+        num_buy_trades, num_sell_trades = self._calculate_trade_counts(filled_orders)
 
         performance_summary = {
             "Pair": pair,
@@ -259,6 +405,7 @@ class TradingPerformanceAnalyzer:
             "End Date": end_date,
             "Duration": duration,
             "ROI": f"{roi:.2f}%",
+            "ROI_raw": float(roi),  # Numeric ROI for programmatic consumers, e.g. parameter sweeps
             "Max Drawdown": f"{max_drawdown:.2f}%",
             "Max Runup": f"{max_runup:.2f}%",
             "Time in Profit %": f"{time_in_profit:.2f}%",
@@ -278,14 +425,20 @@ class TradingPerformanceAnalyzer:
 
         formatted_orders = self.get_formatted_orders()
 
-        orders_table = tabulate(
-            formatted_orders,
-            headers=["Order Side", "Type", "Status", "Price", "Quantity", "Timestamp", "Grid Level", "Slippage"],
-            tablefmt="pipe",
-        )
-        self.logger.info("\nFormatted Orders:\n" + orders_table)
-
-        summary_table = tabulate(performance_summary.items(), headers=["Metric", "Value"], tablefmt="grid")
-        self.logger.info("\nPerformance Summary:\n" + summary_table)
+        # Rendering the tables is the costly part, so skip it when the records would be dropped (e.g. sweeps)
+        if self.logger.isEnabledFor(logging.INFO):
+            orders_table = tabulate(
+                formatted_orders,
+                headers=["Order Side", "Type", "Status", "Price", "Quantity", "Timestamp", "Grid Level", "Slippage"],
+                tablefmt="pipe",
+            )
+            self.logger.info("\nFormatted Orders:\n%s", orders_table)
+
+            summary_table = tabulate(
+                [(metric, value) for metric, value in performance_summary.items() if metric not in RAW_SUMMARY_KEYS],
+                headers=["Metric", "Value"],
+                tablefmt="grid",
+            )
+            self.logger.info("\nPerformance Summary:\n%s", summary_table)
 
         return performance_summary, formatted_orders
@@ -4,11 +4,19 @@ from datetime import timezone, datetime, timedelta
 import unittest
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
-from core.bot_management.event_bus import EventBus
+from config.config_manager import ConfigManager
+from config.trading_mode import TradingMode
+from core.bot_management.event_bus import EventBus, Events
 from core.bot_management.grid_trading_bot import GridTradingBot
 from core.bot_management.health_check import HealthCheck, ResourceMetrics
 from core.bot_management.notification.notification_content import NotificationType
 from core.bot_management.notification.notification_handler import NotificationHandler
+from core.grid_management.grid_manager import GridManager
+from core.order_handling.balance_tracker import BalanceTracker
+from core.order_handling.order_manager import OrderManager
+from core.services.exchange_interface import ExchangeInterface
+from strategies.grid_trading_strategy import GridTradingStrategy
+from strategies.trading_performance_analyzer import TradingPerformanceAnalyzer
 
 
 class TestHealthCheck(unittest.IsolatedAsyncioTestCase):
@@ -31,8 +39,9 @@ class TestHealthCheck(unittest.IsolatedAsyncioTestCase):
                 metrics_history_size=5,  # Small size for testing
             )
 
+    @patch("psutil.cpu_percent")
     @patch("psutil.Process")
-    def test_initialization(self, mock_process):
+    def test_initialization(self, mock_process, mock_cpu_percent):
         """Test that the HealthCheck is properly initialized with metrics history"""
         health_check = HealthCheck(
             bot=self.bot,
@@ -42,7 +51,8 @@ class TestHealthCheck(unittest.IsolatedAsyncioTestCase):
 
         assert health_check.metrics_history_size == 60
         assert len(health_check._metrics_history) == 0
-        mock_process.return_value.cpu_percent.assert_called_once()
+        mock_process.return_value.cpu_percent.assert_called_once_with(interval=None)
+        mock_cpu_percent.assert_called_once_with(interval=None)
 
     @patch("psutil.cpu_percent", return_value=95)
     @patch("psutil.virtual_memory")
@@ -60,10 +70,44 @@ class TestHealthCheck(unittest.IsolatedAsyncioTestCase):
 
         usage = self.health_check._check_resource_usage()
 
+        mock_cpu_percent.assert_called_once_with(interval=None)
         assert usage["cpu"] == 95
         assert usage["memory"] == 85
         assert usage["disk"] == 10
 
+    @patch("psutil.cpu_percent", return_value=10)
+    @patch("psutil.virtual_memory")
+    @patch("psutil.disk_usage")
+    @patch("psutil.Process")
+    def test_check_resource_usage_reuses_process_handle(
+        self,
+        mock_process,
+        mock_disk_usage,
+        mock_virtual_memory,
+        mock_cpu_percent,
+    ):
+        mock_virtual_memory.return_value.total = 16000000000
+        self.health_check.process.memory_info.return_value.rss = 100000000
+        self.health_check.process.open_files.return_value = []
+
+        self.health_check._check_resource_usage()
+        self.health_check._check_resource_usage()
+
+        mock_process.assert_not_called()
+        assert self.health_check.process.oneshot.call_count == 2
+        assert len(self.health_check._metrics_history) == 2
+
+    @patch("psutil.disk_usage")
+    def test_disk_usage_is_throttled(self, mock_disk_usage):
+        mock_disk_usage.return_value.percent = 10
+
+        readings = [self.health_check._get_disk_percent() for _ in range(5)]
+        mock_disk_usage.return_value.percent = 20
+        readings += [self.health_check._get_disk_percent() for _ in range(4)]
+
+        assert mock_disk_usage.call_count == 3
+        assert readings == [10, 10, 10, 10, 10, 10, 10, 10, 20]
+
     async def test_resource_metrics_collection(self):
         """Test that resource metrics are properly collected and stored"""
         with (
@@ -148,7 +192,7 @@ class TestHealthCheck(unittest.IsolatedAsyncioTestCase):
         assert abs(trends["bot_cpu_trend"] - 10.0) < 0.01
         assert abs(trends["bot_memory_trend"] - 20.0) < 0.01
 
-    async def test_resource_alerts_with_trends(self):
+    def test_resource_alerts_with_trends(self):
         """Test that resource alerts include trend information"""
         # Setup resource history
         self.health_check._metrics_history = [
@@ -182,14 +226,12 @@ class TestHealthCheck(unittest.IsolatedAsyncioTestCase):
             "bot_memory_mb": 150.0,
         }
 
-        await self.health_check._check_and_alert_resource_usage(usage)
+        alert_details = " | ".join(self.health_check._check_and_alert_resource_usage(usage))
 
-        # Verify that notifications include trend information
-        self.notification_handler.async_send_notification.assert_awaited_once()
-        call_args = self.notification_handler.async_send_notification.await_args[1]
-        assert "Trend: increasing" in call_args["alert_details"]
-        assert "CPU usage is high: 95.0%" in call_args["alert_details"]
-        assert "MEMORY usage is high: 85.0%" in call_args["alert_details"]
+        # Verify that alerts include trend information
+        assert "Trend: increasing" in alert_details
+        assert "CPU usage is high: 95.0%" in alert_details
+        assert "MEMORY usage is high: 85.0%" in alert_details
 
     async def test_start_and_stop(self):
         self.health_check._perform_checks = AsyncMock()
@@ -209,6 +251,69 @@ class TestHealthCheck(unittest.IsolatedAsyncioTestCase):
 
         assert not self.health_check._is_running
 
+    async def test_start_exits_when_stop_event_is_set(self):
+        self.health_check._perform_checks = AsyncMock()
+        self.health_check.check_interval = 60
+
+        start_task = asyncio.create_task(self.health_check.start())
+        await asyncio.sleep(0.05)
+
+        self.health_check._handle_stop("Test stop")
+        await asyncio.wait_for(start_task, timeout=1)
+
+        self.health_check._perform_checks.assert_awaited_once()
+        assert [t for t in asyncio.all_tasks() if t is not asyncio.current_task()] == []
+
+    async def test_start_does_not_leak_stop_event_waiters(self):
+        self.health_check._perform_checks = AsyncMock()
+        self.health_check.check_interval = 0.01
+
+        start_task = asyncio.create_task(self.health_check.start())
+        await asyncio.sleep(0.1)
+
+        assert self.health_check._perform_checks.await_count > 1
+        assert [t for t in asyncio.all_tasks() if t not in (start_task, asyncio.current_task())] == []
+
+        self.health_check._handle_stop("Test stop")
+        await asyncio.wait_for(start_task, timeout=1)
+
+    async def test_start_keeps_fixed_cadence_despite_slow_checks(self):
+        loop = asyncio.get_running_loop()
+        clock = 0.0
+        check_durations = iter([0.25, 0.25, 1.5, 0.25])
+        check_times = []
+        wait_timeouts = []
+
+        async def slow_check():
+            nonlocal clock
+            check_times.append(clock)
+            clock += next(check_durations)
+
+        async def wait_for(awaitable, timeout):
+            nonlocal clock
+            awaitable.close()
+            wait_timeouts.append(timeout)
+            clock += timeout
+            if len(wait_timeouts) == 4:
+                self.health_check._handle_stop("Test stop")
+                return
+            raise TimeoutError
+
+        self.health_check._perform_checks = slow_check
+        self.health_check.check_interval = 1
+
+        # Checks run on a fake clock, so the cadence doesn't depend on real sleeps
+        with (
+            patch.object(loop, "time", side_effect=lambda: clock),
+            patch("core.bot_management.health_check.asyncio.wait_for", new=wait_for),
+        ):
+            await self.health_check.start()
+
+        # The overrunning third check delays the next one without a catch-up burst
+        assert check_times == [0.0, 1.0, 2.0, 3.5]
+        assert wait_timeouts == [0.75, 0.75, 0.0, 0.75]
+        assert not self.health_check._is_running
+
     async def test_stop_event(self):
         self.health_check._is_running = True
         reason = "User initiated stop"
@@ -226,57 +331,261 @@ class TestHealthCheck(unittest.IsolatedAsyncioTestCase):
         self.health_check.start.assert_awaited_once()
 
     async def test_perform_checks_success(self):
-        self.bot.get_bot_health_status = AsyncMock(return_value={"strategy": True, "exchange_status": "ok"})
+        self.bot.get_bot_health_status = AsyncMock()
         self.health_check._check_resource_usage = Mock(return_value={"cpu": 10, "memory": 10, "disk": 10})
-
-        self.health_check._check_and_alert_bot_health = AsyncMock()
-        self.health_check._check_and_alert_resource_usage = AsyncMock()
+        self.health_check._check_and_alert_resource_usage = Mock(return_value=[])
 
         await self.health_check._perform_checks()
 
-        self.health_check._check_and_alert_bot_health.assert_awaited_with({"strategy": True, "exchange_status": "ok"})
-        self.health_check._check_and_alert_resource_usage.assert_awaited_with({"cpu": 10, "memory": 10, "disk": 10})
+        self.health_check._check_and_alert_resource_usage.assert_called_with({"cpu": 10, "memory": 10, "disk": 10})
+        self.bot.get_bot_health_status.assert_not_awaited()
+        self.notification_handler.async_send_notification.assert_not_awaited()
 
-    async def test_check_and_alert_bot_health_with_alerts(self):
-        health_status = {"strategy": False, "exchange_status": "maintenance"}
+    def test_subscribes_to_health_degradation_events(self):
+        self.event_bus.subscribe.assert_any_call(Events.ORDER_FAILED, self.health_check._handle_order_failed)
+        self.event_bus.subscribe.assert_any_call(
+            Events.EXCHANGE_DISCONNECTED,
+            self.health_check._handle_exchange_disconnected,
+        )
+        self.event_bus.subscribe.assert_any_call(Events.STRATEGY_FAILED, self.health_check._handle_strategy_failed)
 
-        await self.health_check._check_and_alert_bot_health(health_status)
+    async def test_handle_order_failed_alerts_on_unhealthy_bot(self):
+        self.health_check._is_running = True
+        self.bot.get_bot_health_status = AsyncMock(return_value={"strategy": False, "exchange_status": "ok"})
+        self.notification_handler.async_send_notification = AsyncMock()
+
+        await self.health_check._handle_order_failed("Error while placing initial buy order.")
 
         self.notification_handler.async_send_notification.assert_awaited_once_with(
             NotificationType.HEALTH_CHECK_ALERT,
-            alert_details="Trading strategy has encountered issues. | Exchange status is not ok: maintenance",
+            alert_details="Trading strategy has encountered issues.",
         )
 
-    async def test_check_and_alert_bot_health_no_alerts(self):
-        health_status = {"strategy": True, "exchange_status": "ok"}
+    async def test_handle_order_failed_no_alert_on_healthy_bot(self):
+        self.health_check._is_running = True
+        self.bot.get_bot_health_status = AsyncMock(return_value={"strategy": True, "exchange_status": "ok"})
 
-        await self.health_check._check_and_alert_bot_health(health_status)
+        await self.health_check._handle_order_failed("Error while placing initial buy order.")
 
+        self.bot.get_bot_health_status.assert_awaited_once()
         self.notification_handler.async_send_notification.assert_not_awaited()
 
-    async def test_check_and_alert_resource_usage_with_alerts(self):
-        usage = {"cpu": 95, "memory": 85, "disk": 10}
+    async def test_order_failure_burst_triggers_single_bot_health_check(self):
+        event_bus = EventBus()
+        with patch("psutil.Process"):
+            health_check = HealthCheck(
+                bot=self.bot,
+                notification_handler=self.notification_handler,
+                event_bus=event_bus,
+            )
+        health_check._is_running = True
+        self.bot.get_bot_health_status = AsyncMock(return_value={"strategy": True, "exchange_status": "maintenance"})
+        self.notification_handler.async_send_notification = AsyncMock()
 
-        # Initialize empty metrics history to get "stable" trend
-        self.health_check._metrics_history = []
+        for _ in range(10):
+            await event_bus.publish(Events.ORDER_FAILED, "Error while placing initial buy order.")
+        await asyncio.gather(*event_bus._tasks)
+
+        self.bot.get_bot_health_status.assert_awaited_once()
+        self.notification_handler.async_send_notification.assert_awaited_once_with(
+            NotificationType.HEALTH_CHECK_ALERT,
+            alert_details="Exchange status is not ok: maintenance",
+        )
+
+    async def test_order_failures_skipped_while_bot_health_check_in_flight(self):
+        self.health_check._is_running = True
+        self.health_check.order_failure_check_interval = 0
+        release_health_status = asyncio.Event()
+
+        async def slow_health_status():
+            await release_health_status.wait()
+            return {"strategy": True, "exchange_status": "ok"}
+
+        self.bot.get_bot_health_status = AsyncMock(side_effect=slow_health_status)
+
+        first_check = asyncio.create_task(self.health_check._handle_order_failed("Error"))
+        await asyncio.sleep(0)
+        await self.health_check._handle_order_failed("Error")
+        release_health_status.set()
+        await first_check
 
-        await self.health_check._check_and_alert_resource_usage(usage)
+        self.bot.get_bot_health_status.assert_awaited_once()
 
-        expected_message = (
-            "CPU usage is high: 95.0% (Threshold: 90%, Trend: stable) | "
-            "MEMORY usage is high: 85.0% (Threshold: 80%, Trend: stable)"
+    async def test_order_failure_checks_bot_health_again_after_interval(self):
+        self.health_check._is_running = True
+        self.health_check.order_failure_check_interval = 0
+        self.bot.get_bot_health_status = AsyncMock(return_value={"strategy": True, "exchange_status": "ok"})
+
+        await self.health_check._handle_order_failed("Error")
+        await self.health_check._handle_order_failed("Error")
+
+        assert self.bot.get_bot_health_status.await_count == 2
+
+    async def test_exchange_disconnected_not_skipped_after_order_failure_check(self):
+        self.health_check._is_running = True
+        self.bot.get_bot_health_status = AsyncMock(return_value={"strategy": True, "exchange_status": "ok"})
+        self.notification_handler.async_send_notification = AsyncMock()
+
+        await self.health_check._handle_order_failed("Error")
+        await self.health_check._handle_exchange_disconnected("Ticker updates stopped unexpectedly.")
+
+        assert self.bot.get_bot_health_status.await_count == 2
+        self.notification_handler.async_send_notification.assert_awaited_once_with(
+            NotificationType.HEALTH_CHECK_ALERT,
+            alert_details="Exchange disconnected: Ticker updates stopped unexpectedly.",
         )
+
+    async def test_cancelled_start_ignores_later_health_degradation_events(self):
+        self.health_check._perform_checks = AsyncMock()
+        self.health_check.check_interval = 60
+        self.bot.get_bot_health_status = AsyncMock()
+
+        start_task = asyncio.create_task(self.health_check.start())
+        await asyncio.sleep(0.05)
+        start_task.cancel()
+        await start_task
+
+        assert not self.health_check._is_running
+        await self.health_check._handle_exchange_disconnected("Ticker updates stopped unexpectedly.")
+        self.bot.get_bot_health_status.assert_not_awaited()
+
+    async def test_handle_exchange_disconnected_sends_single_batched_alert(self):
+        self.health_check._is_running = True
+        self.bot.get_bot_health_status = AsyncMock(return_value={"strategy": True, "exchange_status": "maintenance"})
+        self.notification_handler.async_send_notification = AsyncMock()
+
+        await self.health_check._handle_exchange_disconnected("Ticker updates stopped unexpectedly.")
+
+        self.notification_handler.async_send_notification.assert_awaited_once_with(
+            NotificationType.HEALTH_CHECK_ALERT,
+            alert_details=(
+                "Exchange disconnected: Ticker updates stopped unexpectedly. | Exchange status is not ok: maintenance"
+            ),
+        )
+
+    async def test_handle_strategy_failed_alerts_even_after_recent_check(self):
+        self.health_check._is_running = True
+        self.bot.get_bot_health_status = AsyncMock(return_value={"strategy": False, "exchange_status": "ok"})
+        self.notification_handler.async_send_notification = AsyncMock()
+
+        await self.health_check._handle_order_failed("Error")
+        self.notification_handler.async_send_notification.reset_mock()
+        await self.health_check._handle_strategy_failed("Unexpected error in live/paper trading loop: Strategy bug")
+
+        assert self.bot.get_bot_health_status.await_count == 2
+        self.notification_handler.async_send_notification.assert_awaited_once_with(
+            NotificationType.HEALTH_CHECK_ALERT,
+            alert_details=(
+                "Trading strategy stopped unexpectedly: Unexpected error in live/paper trading loop: Strategy bug | "
+                "Trading strategy has encountered issues."
+            ),
+        )
+
+    async def test_strategy_exception_triggers_health_check_alert(self):
+        event_bus = EventBus()
+        with patch("psutil.Process"):
+            health_check = HealthCheck(
+                bot=self.bot,
+                notification_handler=self.notification_handler,
+                event_bus=event_bus,
+            )
+        health_check._is_running = True
+        self.bot.get_bot_health_status = AsyncMock(return_value={"strategy": True, "exchange_status": "ok"})
+        self.notification_handler.async_send_notification = AsyncMock()
+        exchange_service = Mock(spec=ExchangeInterface)
+        exchange_service.listen_to_ticker_updates = AsyncMock(side_effect=ValueError("Strategy bug"))
+        strategy = GridTradingStrategy(
+            config_manager=Mock(spec=ConfigManager),
+            event_bus=event_bus,
+            exchange_service=exchange_service,
+            grid_manager=Mock(spec=GridManager),
+            order_manager=Mock(spec=OrderManager),
+            balance_tracker=Mock(spec=BalanceTracker),
+            trading_performance_analyzer=Mock(spec=TradingPerformanceAnalyzer),
+            trading_mode=TradingMode.LIVE,
+            trading_pair="BTC/USDT",
+        )
+
+        await strategy.run()
+        await asyncio.gather(*event_bus._tasks)
+
         self.notification_handler.async_send_notification.assert_awaited_once_with(
             NotificationType.HEALTH_CHECK_ALERT,
-            alert_details=expected_message,
+            alert_details=(
+                "Trading strategy stopped unexpectedly: Unexpected error in live/paper trading loop: Strategy bug"
+            ),
         )
 
-    async def test_check_and_alert_resource_usage_no_alerts(self):
+    async def test_perform_checks_reports_resource_usage_failure(self):
+        self.health_check._check_resource_usage = Mock(side_effect=RuntimeError("proc unavailable"))
+        self.notification_handler.async_send_notification = AsyncMock()
+
+        await self.health_check._perform_checks()
+
+        self.notification_handler.async_send_notification.assert_awaited_once_with(
+            NotificationType.HEALTH_CHECK_ALERT,
+            alert_details="Failed to check system resource usage: proc unavailable",
+        )
+
+    async def test_handle_exchange_disconnected_alerts_when_health_fetch_fails(self):
+        self.health_check._is_running = True
+        self.bot.get_bot_health_status = AsyncMock(side_effect=RuntimeError("exchange unreachable"))
+        self.notification_handler.async_send_notification = AsyncMock()
+
+        await self.health_check._handle_exchange_disconnected("Ticker updates stopped unexpectedly.")
+
+        self.notification_handler.async_send_notification.assert_awaited_once_with(
+            NotificationType.HEALTH_CHECK_ALERT,
+            alert_details=(
+                "Exchange disconnected: Ticker updates stopped unexpectedly. | "
+                "Failed to fetch bot health status: exchange unreachable"
+            ),
+        )
+
+    async def test_health_degradation_ignored_when_not_running(self):
+        self.health_check._is_running = False
+        self.bot.get_bot_health_status = AsyncMock()
+
+        await self.health_check._handle_order_failed("Error")
+        await self.health_check._handle_exchange_disconnected("Error")
+        await self.health_check._handle_strategy_failed("Error")
+
+        self.bot.get_bot_health_status.assert_not_awaited()
+
+    def test_check_and_alert_bot_health_with_alerts(self):
+        health_status = {"strategy": False, "exchange_status": "maintenance"}
+
+        alerts = self.health_check._check_and_alert_bot_health(health_status)
+
+        assert alerts == ["Trading strategy has encountered issues.", "Exchange status is not ok: maintenance"]
+        self.notification_handler.async_send_notification.assert_not_called()
+
+    def test_check_and_alert_bot_health_no_alerts(self):
+        health_status = {"strategy": True, "exchange_status": "ok"}
+
+        alerts = self.health_check._check_and_alert_bot_health(health_status)
+
+        assert alerts == []
+
+    def test_check_and_alert_resource_usage_with_alerts(self):
+        usage = {"cpu": 95, "memory": 85, "disk": 10}
+
+        # Initialize empty metrics history to get "stable" trend
+        self.health_check._metrics_history = []
+
+        alerts = self.health_check._check_and_alert_resource_usage(usage)
+
+        assert alerts == [
+            "CPU usage is high: 95.0% (Threshold: 90%, Trend: stable)",
+            "MEMORY usage is high: 85.0% (Threshold: 80%, Trend: stable)",
+        ]
+
+    def test_check_and_alert_resource_usage_no_alerts(self):
         usage = {"cpu": 10, "memory": 10, "disk": 10}
 
-        await self.health_check._check_and_alert_resource_usage(usage)
+        alerts = self.health_check._check_and_alert_resource_usage(usage)
 
-        self.notification_handler.async_send_notification.assert_not_awaited()
+        assert alerts == []
 
     async def test_start_already_running(self):
         self.health_check._is_running = True
@@ -63,11 +63,20 @@ class TestOrder:
         sample_order.last_trade_timestamp = 1695890800
         assert sample_order.format_last_trade_timestamp() == "2023-09-28T08:46:40"
 
+        # Case 3: Fractional seconds (millisecond timestamps converted to seconds)
+        sample_order.last_trade_timestamp = 1695890800.5
+        assert sample_order.format_last_trade_timestamp() == "2023-09-28T08:46:40.500000"
+
     def test_order_str_representation(self, sample_order):
         order_str = str(sample_order)
         assert "Order(id=123, status=OrderStatus.OPEN" in order_str
         assert "type=OrderType.LIMIT, side=OrderSide.BUY, price=1000.0" in order_str
 
+    def test_order_uses_slots(self, sample_order):
+        assert not hasattr(sample_order, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_order.unknown_field = "value"
+
     def test_order_repr_representation(self, sample_order):
         order_repr = repr(sample_order)
         assert order_repr == str(sample_order)
@@ -162,7 +162,7 @@ class TestOrderManager:
             order_validator,
             balance_tracker,
             _,
-            _,
+            event_bus,
             order_execution_strategy,
             notification_handler,
         ) = setup_order_manager
@@ -193,6 +193,42 @@ class TestOrderManager:
             NotificationType.ORDER_FAILED,
             error_details="Error while placing initial buy order. Test error",
         )
+        event_bus.publish.assert_awaited_with(Events.ORDER_FAILED, "Error while placing initial buy order. Test error")
+
+    @pytest.mark.asyncio
+    async def test_initialize_grid_orders_sell_execution_failed(self, setup_order_manager):
+        (
+            manager,
+            grid_manager,
+            order_validator,
+            balance_tracker,
+            _,
+            event_bus,
+            order_execution_strategy,
+            notification_handler,
+        ) = setup_order_manager
+        grid_manager.sorted_buy_grids = []
+        grid_manager.sorted_sell_grids = [52000]
+        grid_manager.grid_levels = {52000: Mock()}
+        grid_manager.can_place_order.return_value = True
+        order_validator.adjust_and_validate_sell_quantity.return_value = 0.1
+        balance_tracker.crypto_balance = 1
+        order_execution_strategy.execute_limit_order = AsyncMock(
+            side_effect=OrderExecutionFailedError(
+                "Test error", OrderSide.SELL, OrderType.LIMIT, "BTC/USDT", 0.1, 52000
+            ),
+        )
+
+        await manager.initialize_grid_orders(50000)
+
+        notification_handler.async_send_notification.assert_awaited_with(
+            NotificationType.ORDER_FAILED,
+            error_details="Error while placing initial sell order. Test error",
+        )
+        event_bus.publish.assert_awaited_once_with(
+            Events.ORDER_FAILED,
+            "Error while placing initial sell order. Test error",
+        )
 
     @pytest.mark.asyncio
     async def test_initialize_grid_orders_insufficient_balance(self, setup_order_manager):
@@ -226,6 +262,34 @@ class TestOrderManager:
 
         manager._handle_order_completion.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_on_order_filled_execution_failed(self, setup_order_manager):
+        manager, _, _, _, order_book, event_bus, _, notification_handler = setup_order_manager
+        order_book.get_grid_level_for_order.return_value = Mock()
+        manager._handle_order_completion = AsyncMock(
+            side_effect=OrderExecutionFailedError(
+                "Test error", OrderSide.SELL, OrderType.LIMIT, "BTC/USDT", 0.1, 52000
+            ),
+        )
+
+        await manager._on_order_filled(Mock())
+
+        notification_handler.async_send_notification.assert_awaited_once_with(
+            NotificationType.ORDER_FAILED,
+            error_details="Failed handling filled order. Test error",
+        )
+        event_bus.publish.assert_awaited_once_with(Events.ORDER_FAILED, "Failed handling filled order. Test error")
+
+    @pytest.mark.asyncio
+    async def test_on_order_filled_unexpected_error_does_not_publish_order_failed(self, setup_order_manager):
+        manager, _, _, _, order_book, event_bus, _, _ = setup_order_manager
+        order_book.get_grid_level_for_order.return_value = Mock()
+        manager._handle_order_completion = AsyncMock(side_effect=Exception("Unexpected error"))
+
+        await manager._on_order_filled(Mock())
+
+        event_bus.publish.assert_not_awaited()
+
     def test_get_or_create_paired_buy_level_no_fallback(self, setup_order_manager):
         manager, grid_manager, _, _, _, _, _, _ = setup_order_manager
         mock_sell_grid_level = Mock(paired_buy_level=None)
@@ -306,6 +370,27 @@ class TestOrderManager:
 
         order_execution_strategy.execute_market_order.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_perform_initial_purchase_execution_failed(self, setup_order_manager):
+        manager, grid_manager, _, _, _, event_bus, order_execution_strategy, notification_handler = setup_order_manager
+        grid_manager.get_initial_order_quantity.return_value = 0.01
+        order_execution_strategy.execute_market_order = AsyncMock(
+            side_effect=OrderExecutionFailedError(
+                "Test error", OrderSide.BUY, OrderType.MARKET, "BTC/USDT", 0.01, 50000
+            ),
+        )
+
+        await manager.perform_initial_purchase(50000)
+
+        notification_handler.async_send_notification.assert_awaited_once_with(
+            NotificationType.ORDER_FAILED,
+            error_details="Error while performing initial purchase. Test error",
+        )
+        event_bus.publish.assert_awaited_once_with(
+            Events.ORDER_FAILED,
+            "Error while performing initial purchase. Test error",
+        )
+
     @pytest.mark.asyncio
     async def test_execute_take_profit_or_stop_loss_order_no_action(self, setup_order_manager):
         manager, _, _, _, _, _, order_execution_strategy, _ = setup_order_manager
@@ -316,7 +401,9 @@ class TestOrderManager:
 
     @pytest.mark.asyncio
     async def test_execute_take_profit_or_stop_loss_order_failure(self, setup_order_manager):
-        manager, _, _, balance_tracker, _, _, order_execution_strategy, notification_handler = setup_order_manager
+        manager, _, _, balance_tracker, _, event_bus, order_execution_strategy, notification_handler = (
+            setup_order_manager
+        )
         balance_tracker.crypto_balance = 0.5
 
         # Mock the order execution to raise an error
@@ -338,6 +425,10 @@ class TestOrderManager:
             NotificationType.ORDER_FAILED,
             error_details="Failed to place Take profit order: Order execution failed",
         )
+        event_bus.publish.assert_awaited_once_with(
+            Events.ORDER_FAILED,
+            "Failed to place Take profit order: Order execution failed",
+        )
 
     @pytest.mark.asyncio
     async def test_handle_sell_order_completion_no_paired_level(self, setup_order_manager):
@@ -102,7 +102,7 @@ class TestOrderStatusTracker:
         with patch.object(tracker.logger, "info") as mock_logger_info:
             tracker._handle_order_status_change(mock_remote_order)
 
-            mock_logger_info.assert_called_once_with(f"Order {mock_remote_order} is still open. No fills yet.")
+            mock_logger_info.assert_called_once_with("Order %s is still open. No fills yet.", mock_remote_order)
 
     def test_handle_order_status_change_partially_filled(self, setup_tracker):
         tracker, _, _, _ = setup_tracker
@@ -1,5 +1,9 @@
+import asyncio
+from collections.abc import Callable
+import contextlib
+from dataclasses import dataclass
 import logging
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import numpy as np
 import pandas as pd
@@ -7,33 +11,105 @@ import pytest
 
 from config.config_manager import ConfigManager
 from config.trading_mode import TradingMode
-from core.bot_management.event_bus import EventBus
+from core.bot_management.event_bus import EventBus, Events
 from core.grid_management.grid_manager import GridManager
 from core.order_handling.balance_tracker import BalanceTracker
 from core.order_handling.order_manager import OrderManager
+from core.services.exceptions import DataFetchError
 from core.services.exchange_interface import ExchangeInterface
 from strategies.grid_trading_strategy import GridTradingStrategy
 from strategies.plotter import Plotter
 from strategies.trading_performance_analyzer import TradingPerformanceAnalyzer
 
+_BACKTEST_DF = pd.DataFrame(
+    {
+        "close": [10000, 10500, 11000],
+        "high": [10100, 10600, 11100],
+        "low": [9900, 10400, 10900],
+        "account_value": np.full(3, np.nan, dtype=np.float64),
+    },
+    index=pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-03"]),
+)
+
+# Read-only: shared by tests that never mutate strategy.data
+_CLOSE_ONLY_DF = pd.DataFrame({"close": np.array([10000, 10500, 11000], dtype=np.float64)})
+
+
+def _seq_side_effect(values):
+    """
+    Returns a side_effect callable yielding ``values`` one per call, for per-candle stubs in backtest tests.
+    """
+    values = iter(values)
+    return lambda *args, **kwargs: next(values)
+
+
+@dataclass(slots=True)
+class Harness:
+    create_strategy: Callable[..., GridTradingStrategy]
+    config_manager: Mock
+    exchange_service: Mock
+    grid_manager: Mock
+    order_manager: Mock
+    balance_tracker: Mock
+    trading_performance_analyzer: Mock
+    plotter: Mock
+    event_bus: Mock
+
 
 class TestGridTradingStrategy:
-    @pytest.fixture
-    def setup_strategy(self):
-        config_manager = Mock(spec=ConfigManager)
+    @pytest.fixture(scope="module")
+    def strategy_mocks(self):
+        config_manager = Mock(spec_set=ConfigManager)
+        # listen_to_ticker_updates is only implemented by the live exchange service, not by ExchangeInterface
         exchange_service = Mock(spec=ExchangeInterface)
-        grid_manager = Mock(spec=GridManager)
-        order_manager = Mock(spec=OrderManager)
+        exchange_service.listen_to_ticker_updates = AsyncMock()
+        grid_manager = Mock(spec_set=GridManager)
+        order_manager = Mock(spec_set=OrderManager)
+        # crypto_balance / total_fees are instance attributes, so they are not part of a class spec_set
         balance_tracker = Mock(spec=BalanceTracker)
-        trading_performance_analyzer = Mock(spec=TradingPerformanceAnalyzer)
-        plotter = Mock(spec=Plotter)
-        event_bus = Mock(spec=EventBus)
+        trading_performance_analyzer = Mock(spec_set=TradingPerformanceAnalyzer)
+        plotter = Mock(spec_set=Plotter)
+        event_bus = Mock(spec_set=EventBus)
 
-        config_manager.get_timeframe.return_value = "1d"
-        config_manager.is_take_profit_enabled.return_value = True
-        config_manager.is_stop_loss_enabled.return_value = True
-        config_manager.get_take_profit_threshold.return_value = 20000
-        config_manager.get_stop_loss_threshold.return_value = 10000
+        return (
+            config_manager,
+            exchange_service,
+            grid_manager,
+            order_manager,
+            balance_tracker,
+            trading_performance_analyzer,
+            plotter,
+            event_bus,
+        )
+
+    @pytest.fixture
+    def harness(self, strategy_mocks):
+        for mock in strategy_mocks:
+            mock.reset_mock(return_value=True, side_effect=True)
+
+        (
+            config_manager,
+            exchange_service,
+            grid_manager,
+            order_manager,
+            balance_tracker,
+            trading_performance_analyzer,
+            plotter,
+            event_bus,
+        ) = strategy_mocks
+
+        config_manager.configure_mock(
+            **{
+                "get_timeframe.return_value": "1d",
+                "is_take_profit_enabled.return_value": True,
+                "is_stop_loss_enabled.return_value": True,
+                "get_take_profit_threshold.return_value": 20000,
+                "get_stop_loss_threshold.return_value": 10000,
+            },
+        )
+        # Plain data attributes are not touched by reset_mock, so restore them explicitly
+        balance_tracker.crypto_balance = 0
+        balance_tracker.total_fees = 0
 
         def create_strategy(trading_mode: TradingMode = TradingMode.BACKTEST):
             return GridTradingStrategy(
@@ -49,44 +125,51 @@ class TestGridTradingStrategy:
                 plotter=plotter,
             )
 
-        return (
-            create_strategy,
-            config_manager,
-            exchange_service,
-            grid_manager,
-            order_manager,
-            balance_tracker,
-            trading_performance_analyzer,
-            plotter,
-            event_bus,
+        return Harness(
+            create_strategy=create_strategy,
+            config_manager=config_manager,
+            exchange_service=exchange_service,
+            grid_manager=grid_manager,
+            order_manager=order_manager,
+            balance_tracker=balance_tracker,
+            trading_performance_analyzer=trading_performance_analyzer,
+            plotter=plotter,
+            event_bus=event_bus,
         )
 
-    @pytest.mark.asyncio
-    async def test_initialize_strategy(self, setup_strategy):
-        create_strategy, _, _, grid_manager, *_ = setup_strategy
-        strategy = create_strategy()
+    @pytest.fixture
+    def capture_messages(self):
+        logger = logging.getLogger(GridTradingStrategy.__name__)
+        messages = []
+        handler = logging.Handler()
+        handler.emit = lambda record: messages.append(record.getMessage())
+        previous_level = logger.level
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        try:
+            yield messages
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(previous_level)
+
+    def test_initialize_strategy(self, harness):
+        strategy = harness.create_strategy()
 
         strategy.initialize_strategy()
 
-        grid_manager.initialize_grids_and_levels.assert_called_once()
+        harness.grid_manager.initialize_grids_and_levels.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_stop_trading(self, setup_strategy):
-        create_strategy, _, exchange_service, *_ = setup_strategy
-        strategy = create_strategy()
-        exchange_service.close_connection = AsyncMock()
+    async def test_stop_trading(self, harness):
+        strategy = harness.create_strategy()
 
         await strategy.stop()
 
         assert strategy._running is False
-        exchange_service.close_connection.assert_called_once()
+        harness.exchange_service.close_connection.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_restart_live_trading(self, setup_strategy):
-        create_strategy, _, exchange_service, grid_manager, _, _, _, _, _ = setup_strategy
-        strategy = create_strategy(TradingMode.LIVE)
-        grid_manager.get_trigger_price.return_value = 10500
-        exchange_service.listen_to_ticker_updates = AsyncMock()
+    async def test_restart_live_trading(self, harness):
+        strategy = harness.create_strategy(TradingMode.LIVE)
+        harness.grid_manager.get_trigger_price.return_value = 10500
         strategy._running = False
 
         await strategy.restart()
@@ -95,7 +178,7 @@ class TestGridTradingStrategy:
         assert strategy._running is True, "Expected strategy to be running after restart in LIVE mode."
 
         # Extract the actual callback passed to `listen_to_ticker_updates`
-        actual_call_args = exchange_service.listen_to_ticker_updates.call_args
+        actual_call_args = harness.exchange_service.listen_to_ticker_updates.call_args
         actual_callback = actual_call_args[0][1]  # Extract the callback argument
 
         # Verify `listen_to_ticker_updates` was called with the correct parameters
@@ -105,392 +188,326 @@ class TestGridTradingStrategy:
         )
         assert callable(actual_callback), "Expected a callable callback for on_ticker_update."
 
-    @pytest.mark.asyncio
-    async def test_run_backtest(self, setup_strategy):
-        create_strategy, _, _, grid_manager, order_manager, balance_tracker, *_ = setup_strategy
-        strategy = create_strategy()
-
-        strategy.data = pd.DataFrame(
-            {
-                "close": [10000, 10500, 11000],
-                "high": [10100, 10600, 11100],
-                "low": [9900, 10400, 10900],
-                "account_value": [np.nan, np.nan, np.nan],
-            },
-            index=pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
-        )
-
-        balance_tracker.get_total_balance_value.side_effect = [9000, 9500, 10000, 10000]
-        balance_tracker.crypto_balance = 1
-        grid_manager.get_trigger_price.return_value = 8900
-        order_manager.simulate_order_fills = AsyncMock()
-        order_manager.initialize_grid_orders = AsyncMock()
-        strategy._initialize_grid_orders_once = AsyncMock(side_effect=[False, True, True])
-        strategy._handle_take_profit_stop_loss = AsyncMock(side_effect=[False, False, False])
+    async def test_run_backtest(self, harness):
+        strategy = harness.create_strategy()
+
+        # run() writes account_value in place, so work on a copy of the shared frame
+        strategy.data = _BACKTEST_DF.copy()
+
+        harness.balance_tracker.get_total_balance_value.side_effect = _seq_side_effect([9000, 9500, 10000, 10000])
+        harness.balance_tracker.crypto_balance = 1
+        harness.grid_manager.get_trigger_price.return_value = 8900
+        grid_orders_initialized = iter([False, True, True])
+        tp_sl_checked_prices = []
+
+        async def initialize_grid_orders_once(*args, **kwargs):
+            return next(grid_orders_initialized)
+
+        async def handle_take_profit_stop_loss(current_price):
+            tp_sl_checked_prices.append(current_price)
+            return False
+
+        with (
+            patch.object(strategy, "_initialize_grid_orders_once", initialize_grid_orders_once),
+            patch.object(strategy, "_handle_take_profit_stop_loss", handle_take_profit_stop_loss),
+        ):
+            await strategy.run()
+
+        np.testing.assert_array_equal(strategy.data["account_value"].to_numpy(), np.array([9500.0, 10000.0, 10000.0]))
+        assert tp_sl_checked_prices == [10500, 11000]
+
+    @pytest.mark.parametrize(
+        ("side_effect", "stops_strategy", "expected_event", "expected_reason"),
+        [
+            (None, False, Events.EXCHANGE_DISCONNECTED, "Ticker updates stopped unexpectedly."),
+            (
+                DataFetchError("Connection error"),
+                False,
+                Events.EXCHANGE_DISCONNECTED,
+                "Error in live/paper trading loop: Connection error",
+            ),
+            (
+                ValueError("Strategy bug"),
+                False,
+                Events.STRATEGY_FAILED,
+                "Unexpected error in live/paper trading loop: Strategy bug",
+            ),
+            (None, True, None, None),
+        ],
+        ids=["updates_stopped", "error_handling", "unexpected_error", "stop_condition"],
+    )
+    async def test_run_live_trading(
+        self,
+        harness,
+        side_effect,
+        stops_strategy,
+        expected_event,
+        expected_reason,
+    ):
+        strategy = harness.create_strategy(TradingMode.LIVE)
+
+        if stops_strategy:
+
+            async def stop_strategy(*args, **kwargs):
+                strategy._running = False
+
+            side_effect = stop_strategy
+
+        harness.exchange_service.listen_to_ticker_updates.side_effect = side_effect
 
         await strategy.run()
 
-        expected_account_values = pd.Series([9500, 10000, 10000], index=strategy.data.index, name="account_value")
-        pd.testing.assert_series_equal(strategy.data["account_value"], expected_account_values.astype("float64"))
-        strategy._handle_take_profit_stop_loss.assert_awaited()
+        harness.exchange_service.listen_to_ticker_updates.assert_called_once()
+        if expected_event is None:
+            assert not strategy._running
+            harness.event_bus.publish.assert_not_awaited()
+        else:
+            harness.event_bus.publish.assert_awaited_once_with(expected_event, expected_reason)
 
-    @pytest.mark.asyncio
-    async def test_run_live_trading(self, setup_strategy):
-        create_strategy, _, exchange_service, *_ = setup_strategy
-        strategy = create_strategy(TradingMode.LIVE)
-        exchange_service.listen_to_ticker_updates = AsyncMock()
+    async def test_run_live_trading_cancelled_does_not_report_disconnect(self, harness):
+        strategy = harness.create_strategy(TradingMode.LIVE)
+        listening = asyncio.Event()
 
-        await strategy.run()
+        async def listen_until_cancelled(*args, **kwargs):
+            # Mirrors LiveExchangeService, which swallows the cancellation and returns
+            listening.set()
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.Event().wait()
+
+        harness.exchange_service.listen_to_ticker_updates.side_effect = listen_until_cancelled
 
-        exchange_service.listen_to_ticker_updates.assert_called_once()
+        run_task = asyncio.create_task(strategy.run())
+        await listening.wait()
+        run_task.cancel()
+        await run_task
 
-    def test_generate_performance_report(self, setup_strategy):
-        create_strategy, _, _, _, _, balance_tracker, trading_performance_analyzer, _, _ = setup_strategy
-        strategy = create_strategy()
-        strategy.data = pd.DataFrame({"close": [10000, 10500, 11000]})
+        assert strategy._running
+        harness.event_bus.publish.assert_not_awaited()
+
+    def test_generate_performance_report(self, harness):
+        strategy = harness.create_strategy()
+        strategy.data = _CLOSE_ONLY_DF
         strategy.close_prices = strategy.data["close"].values
         initial_price = strategy.data["close"].iloc[0]
         final_price = strategy.data["close"].iloc[-1]
-        balance_tracker.get_adjusted_fiat_balance.return_value = 5000
-        balance_tracker.get_adjusted_crypto_balance.return_value = 1
-        balance_tracker.total_fees = 10
-        trading_performance_analyzer.generate_performance_summary = Mock()
+        harness.balance_tracker.get_adjusted_fiat_balance.return_value = 5000
+        harness.balance_tracker.get_adjusted_crypto_balance.return_value = 1
+        harness.balance_tracker.total_fees = 10
 
         strategy.generate_performance_report()
 
-        trading_performance_analyzer.generate_performance_summary.assert_called_once_with(
+        harness.trading_performance_analyzer.generate_performance_summary.assert_called_once_with(
             strategy.data,
             initial_price,
-            balance_tracker.get_adjusted_fiat_balance(),
-            balance_tracker.get_adjusted_crypto_balance(),
+            harness.balance_tracker.get_adjusted_fiat_balance(),
+            harness.balance_tracker.get_adjusted_crypto_balance(),
             final_price,
-            balance_tracker.total_fees,
+            harness.balance_tracker.total_fees,
         )
 
-    def test_plot_results(self, setup_strategy):
-        create_strategy, _, _, _, _, _, _, plotter, _ = setup_strategy
-        strategy = create_strategy()
-        strategy.data = pd.DataFrame({"close": [10000, 10500, 11000]})
+    def test_plot_results(self, harness):
+        strategy = harness.create_strategy()
+        strategy.data = _CLOSE_ONLY_DF
 
         strategy.plot_results()
 
-        plotter.plot_results.assert_called_once_with(strategy.data)
+        harness.plotter.plot_results.assert_called_once_with(strategy.data)
 
-    def test_plot_results_not_available_in_live_mode(self, setup_strategy, caplog):
-        create_strategy, _, _, _, _, _, _, plotter, _ = setup_strategy
-        strategy = create_strategy(TradingMode.LIVE)
+    def test_plot_results_not_available_in_live_mode(self, harness, capture_messages):
+        strategy = harness.create_strategy(TradingMode.LIVE)
 
-        with caplog.at_level(logging.INFO):
-            strategy.plot_results()
+        strategy.plot_results()
 
-        assert "Plotting is not available for live/paper trading mode." in [record.message for record in caplog.records]
-        plotter.plot_results.assert_not_called()
+        assert "Plotting is not available for live/paper trading mode." in capture_messages
+        harness.plotter.plot_results.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_initialize_historical_data_live_mode(self, setup_strategy):
-        create_strategy, _, _, _, _, _, _, _, _ = setup_strategy
-        strategy = create_strategy(TradingMode.LIVE)
+    def test_initialize_historical_data_live_mode(self, harness):
+        strategy = harness.create_strategy(TradingMode.LIVE)
 
         result = strategy._initialize_historical_data()
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_initialize_historical_data_backtest_mode(self, setup_strategy):
-        create_strategy, config_manager, exchange_service, _, _, _, _, _, _ = setup_strategy
-
-        config_manager.get_timeframe.return_value = "1h"
-        config_manager.get_start_date.return_value = "2024-01-01"
-        config_manager.get_end_date.return_value = "2024-01-02"
+    def test_initialize_historical_data_backtest_mode(self, harness):
+        harness.config_manager.get_timeframe.return_value = "1h"
+        harness.config_manager.get_start_date.return_value = "2024-01-01"
+        harness.config_manager.get_end_date.return_value = "2024-01-02"
 
         mock_data = pd.DataFrame({"close": [100, 200, 300]})
-        exchange_service.fetch_ohlcv.return_value = mock_data
+        harness.exchange_service.fetch_ohlcv.return_value = mock_data
 
-        strategy = create_strategy(TradingMode.BACKTEST)
-        exchange_service.fetch_ohlcv.reset_mock()
+        strategy = harness.create_strategy(TradingMode.BACKTEST)
+        harness.exchange_service.fetch_ohlcv.reset_mock()
 
         result = strategy._initialize_historical_data()
 
         assert result is not None
         assert isinstance(result, pd.DataFrame)
-        exchange_service.fetch_ohlcv.assert_called_once_with(
+        harness.exchange_service.fetch_ohlcv.assert_called_once_with(
             "BTC/USDT",
             "1h",
             "2024-01-01",
             "2024-01-02",
         )
 
-    @pytest.mark.asyncio
-    async def test_initialize_historical_data_error(self, setup_strategy, caplog):
-        create_strategy, _, exchange_service, _, _, _, _, _, _ = setup_strategy
-        strategy = create_strategy(TradingMode.BACKTEST)
+    def test_initialize_historical_data_error(self, harness, capture_messages):
+        strategy = harness.create_strategy(TradingMode.BACKTEST)
 
         # Mock the exchange service to raise an exception
-        exchange_service.fetch_ohlcv.side_effect = Exception("Failed to fetch data")
+        harness.exchange_service.fetch_ohlcv.side_effect = Exception("Failed to fetch data")
 
-        with caplog.at_level(logging.ERROR):
-            result = strategy._initialize_historical_data()
+        result = strategy._initialize_historical_data()
 
         assert result is None
-        assert "Failed to initialize data for backtest trading mode" in caplog.text
+        assert "Failed to initialize data for backtest trading mode: Failed to fetch data" in capture_messages
 
-    @pytest.mark.asyncio
-    async def test_evaluate_tp_or_sl_no_crypto_balance(self, setup_strategy):
-        create_strategy, _, _, _, _, balance_tracker, _, _, _ = setup_strategy
-        strategy = create_strategy()
+    async def test_evaluate_tp_or_sl_no_crypto_balance(self, harness):
+        strategy = harness.create_strategy()
 
-        balance_tracker.crypto_balance = 0
+        harness.balance_tracker.crypto_balance = 0
 
         result = await strategy._evaluate_tp_or_sl(current_price=15000)
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_handle_take_profit_triggered(self, setup_strategy):
-        create_strategy, config_manager, _, _, order_manager, balance_tracker, _, _, _ = setup_strategy
-        strategy = create_strategy()
-
-        config_manager.is_take_profit_enabled.return_value = True
-        config_manager.get_take_profit_threshold.return_value = 20000
-        balance_tracker.crypto_balance = 1
-        order_manager.execute_take_profit_or_stop_loss_order = AsyncMock()
-
-        result = await strategy._handle_take_profit(current_price=21000)
-
-        assert result is True
-        order_manager.execute_take_profit_or_stop_loss_order.assert_called_once_with(
-            current_price=21000,
-            take_profit_order=True,
-        )
-
-    @pytest.mark.asyncio
-    async def test_handle_stop_loss_triggered(self, setup_strategy):
-        create_strategy, config_manager, _, _, order_manager, balance_tracker, _, _, _ = setup_strategy
-        strategy = create_strategy()
-
-        config_manager.is_stop_loss_enabled.return_value = True
-        config_manager.get_stop_loss_threshold.return_value = 10000
-        balance_tracker.crypto_balance = 1
-        order_manager.execute_take_profit_or_stop_loss_order = AsyncMock()
-
-        result = await strategy._handle_stop_loss(current_price=9000)
-
-        assert result is True
-        order_manager.execute_take_profit_or_stop_loss_order.assert_called_once_with(
-            current_price=9000,
-            stop_loss_order=True,
-        )
-
-    @pytest.mark.asyncio
-    async def test_initialize_grid_orders_once_first_time(self, setup_strategy):
-        create_strategy, _, _, grid_manager, order_manager, _, _, _, _ = setup_strategy
-        strategy = create_strategy()
+    @pytest.mark.parametrize(
+        ("handler", "current_price", "triggered_order_kwarg"),
+        [
+            ("_handle_take_profit", 21000, "take_profit_order"),
+            ("_handle_take_profit", 19000, None),
+            ("_handle_stop_loss", 9000, "stop_loss_order"),
+            ("_handle_stop_loss", 11000, None),
+        ],
+        ids=["take_profit_triggered", "take_profit_not_triggered", "stop_loss_triggered", "stop_loss_not_triggered"],
+    )
+    async def test_handle_take_profit_and_stop_loss(
+        self,
+        harness,
+        handler,
+        current_price,
+        triggered_order_kwarg,
+    ):
+        strategy = harness.create_strategy()
+
+        harness.balance_tracker.crypto_balance = 1
+
+        result = await getattr(strategy, handler)(current_price=current_price)
+
+        assert result is (triggered_order_kwarg is not None)
+        if triggered_order_kwarg is None:
+            harness.order_manager.execute_take_profit_or_stop_loss_order.assert_not_called()
+        else:
+            harness.order_manager.execute_take_profit_or_stop_loss_order.assert_called_once_with(
+                current_price=current_price,
+                **{triggered_order_kwarg: True},
+            )
 
-        grid_manager.get_trigger_price.return_value = 15000
-        order_manager.perform_initial_purchase = AsyncMock()
-        order_manager.initialize_grid_orders = AsyncMock()
+    @pytest.mark.parametrize(
+        ("current_price", "trigger_price", "grid_orders_initialized", "last_price", "expected", "orders_placed"),
+        [
+            (15100, 15000, False, 14900, True, True),
+            (15100, 15000, True, 14900, True, False),
+            (15100, 15000, False, None, False, False),
+            (15000, 15000, False, 15000, True, True),
+        ],
+        ids=["first_time", "already_initialized", "no_last_price", "trigger_price_equals_last_price"],
+    )
+    async def test_initialize_grid_orders_once(
+        self,
+        harness,
+        current_price,
+        trigger_price,
+        grid_orders_initialized,
+        last_price,
+        expected,
+        orders_placed,
+    ):
+        strategy = harness.create_strategy()
 
         result = await strategy._initialize_grid_orders_once(
-            current_price=15100,
-            trigger_price=15000,
-            grid_orders_initialized=False,
-            last_price=14900,
+            current_price=current_price,
+            trigger_price=trigger_price,
+            grid_orders_initialized=grid_orders_initialized,
+            last_price=last_price,
         )
 
-        assert result is True
-        order_manager.perform_initial_purchase.assert_called_once_with(15100)
-        order_manager.initialize_grid_orders.assert_called_once_with(15100)
+        assert result is expected
+        if orders_placed:
+            harness.order_manager.perform_initial_purchase.assert_called_once_with(current_price)
+            harness.order_manager.initialize_grid_orders.assert_called_once_with(current_price)
+        else:
+            harness.order_manager.perform_initial_purchase.assert_not_called()
+            harness.order_manager.initialize_grid_orders.assert_not_called()
 
-    def test_get_formatted_orders(self, setup_strategy):
-        create_strategy, _, _, _, _, _, trading_performance_analyzer, _, _ = setup_strategy
-        strategy = create_strategy()
+    def test_get_formatted_orders(self, harness):
+        strategy = harness.create_strategy()
 
         mock_orders = ["Order1", "Order2"]
-        trading_performance_analyzer.get_formatted_orders.return_value = mock_orders
+        harness.trading_performance_analyzer.get_formatted_orders.return_value = mock_orders
 
         result = strategy.get_formatted_orders()
 
         assert result == mock_orders
-        trading_performance_analyzer.get_formatted_orders.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_handle_take_profit_not_triggered(self, setup_strategy):
-        create_strategy, config_manager, _, _, order_manager, balance_tracker, _, _, _ = setup_strategy
-        strategy = create_strategy()
-
-        config_manager.is_take_profit_enabled.return_value = True
-        config_manager.get_take_profit_threshold.return_value = 20000
-        balance_tracker.crypto_balance = 1
-        order_manager.execute_take_profit_or_stop_loss_order = AsyncMock()
-
-        result = await strategy._handle_take_profit(current_price=19000)
-
-        assert result is False
-        order_manager.execute_take_profit_or_stop_loss_order.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handle_stop_loss_not_triggered(self, setup_strategy):
-        create_strategy, config_manager, _, _, order_manager, balance_tracker, _, _, _ = setup_strategy
-        strategy = create_strategy()
-
-        config_manager.is_stop_loss_enabled.return_value = True
-        config_manager.get_stop_loss_threshold.return_value = 10000
-        balance_tracker.crypto_balance = 1
-        order_manager.execute_take_profit_or_stop_loss_order = AsyncMock()
-
-        result = await strategy._handle_stop_loss(current_price=11000)
-
-        assert result is False
-        order_manager.execute_take_profit_or_stop_loss_order.assert_not_called()
+        harness.trading_performance_analyzer.get_formatted_orders.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_handle_take_profit_stop_loss_both_triggered(self, setup_strategy):
-        create_strategy, config_manager, _, _, order_manager, balance_tracker, _, _, event_bus = setup_strategy
-        strategy = create_strategy()
+    async def test_handle_take_profit_stop_loss_both_triggered(self, harness):
+        strategy = harness.create_strategy()
 
-        config_manager.is_take_profit_enabled.return_value = True
-        config_manager.get_take_profit_threshold.return_value = 20000
-        balance_tracker.crypto_balance = 1
-        order_manager.execute_take_profit_or_stop_loss_order = AsyncMock()
-        event_bus.publish = AsyncMock()
+        harness.config_manager.is_take_profit_enabled.return_value = True
+        harness.config_manager.get_take_profit_threshold.return_value = 20000
+        harness.balance_tracker.crypto_balance = 1
 
         result = await strategy._handle_take_profit_stop_loss(current_price=21000)
 
         assert result is True
-        event_bus.publish.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_initialize_grid_orders_once_already_initialized(self, setup_strategy):
-        create_strategy, _, _, _, order_manager, _, _, _, _ = setup_strategy
-        strategy = create_strategy()
-
-        order_manager.perform_initial_purchase = AsyncMock()
-        order_manager.initialize_grid_orders = AsyncMock()
-
-        result = await strategy._initialize_grid_orders_once(
-            current_price=15100,
-            trigger_price=15000,
-            grid_orders_initialized=True,
-            last_price=14900,
-        )
-
-        assert result is True
-        order_manager.perform_initial_purchase.assert_not_called()
-        order_manager.initialize_grid_orders.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_initialize_grid_orders_once_no_last_price(self, setup_strategy):
-        create_strategy, _, _, _, order_manager, _, _, _, _ = setup_strategy
-        strategy = create_strategy()
-
-        order_manager.perform_initial_purchase = AsyncMock()
-        order_manager.initialize_grid_orders = AsyncMock()
-
-        result = await strategy._initialize_grid_orders_once(
-            current_price=15100,
-            trigger_price=15000,
-            grid_orders_initialized=False,
-            last_price=None,
-        )
-
-        assert result is False
-        order_manager.perform_initial_purchase.assert_not_called()
-        order_manager.initialize_grid_orders.assert_not_called()
-
-    def test_generate_performance_report_live_mode(self, setup_strategy):
-        create_strategy, _, _, _, _, balance_tracker, trading_performance_analyzer, _, _ = setup_strategy
-        strategy = create_strategy(TradingMode.LIVE)
-
-        balance_tracker.get_adjusted_fiat_balance.return_value = 5000
-        balance_tracker.get_adjusted_crypto_balance.return_value = 1
-        balance_tracker.total_fees = 10
-
-        strategy.live_trading_metrics = [
-            (pd.Timestamp("2024-01-01"), 10000, 100),
-            (pd.Timestamp("2024-01-02"), 11000, 110),
-        ]
-
-        strategy.generate_performance_report()
-
-        trading_performance_analyzer.generate_performance_summary.assert_called_once()
-
-    def test_generate_performance_report_live_mode_no_metrics(self, setup_strategy):
-        create_strategy, _, _, _, _, _, trading_performance_analyzer, _, _ = setup_strategy
-        strategy = create_strategy(TradingMode.LIVE)
-
-        result, formatted_orders = strategy.generate_performance_report()
-
-        assert result == {}
-        assert formatted_orders == []
-        trading_performance_analyzer.generate_performance_summary.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_run_live_trading_error_handling(self, setup_strategy):
-        create_strategy, _, exchange_service, _, _, _, _, _, _ = setup_strategy
-        strategy = create_strategy(TradingMode.LIVE)
-
-        exchange_service.listen_to_ticker_updates = AsyncMock(side_effect=Exception("Connection error"))
-
-        await strategy.run()
-
-        exchange_service.listen_to_ticker_updates.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_run_backtest_with_no_data(self, setup_strategy):
-        create_strategy, _, _, _, _, _, _, _, _ = setup_strategy
-        strategy = create_strategy(TradingMode.BACKTEST)
+        harness.event_bus.publish.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("live_trading_metrics", "expected_summary_calls"),
+        [
+            ([], 0),
+            (
+                [
+                    (pd.Timestamp("2024-01-01"), 10000, 100),
+                    (pd.Timestamp("2024-01-02"), 11000, 110),
+                ],
+                1,
+            ),
+        ],
+        ids=["no_metrics", "with_metrics"],
+    )
+    def test_generate_performance_report_live_mode(self, harness, live_trading_metrics, expected_summary_calls):
+        strategy = harness.create_strategy(TradingMode.LIVE)
+
+        harness.balance_tracker.get_adjusted_fiat_balance.return_value = 5000
+        harness.balance_tracker.get_adjusted_crypto_balance.return_value = 1
+        harness.balance_tracker.total_fees = 10
+        strategy.live_trading_metrics = live_trading_metrics
+
+        result = strategy.generate_performance_report()
+
+        assert harness.trading_performance_analyzer.generate_performance_summary.call_count == expected_summary_calls
+        if not expected_summary_calls:
+            assert result == ({}, [])
+
+    async def test_run_backtest_with_no_data(self, harness):
+        strategy = harness.create_strategy(TradingMode.BACKTEST)
         strategy.data = None
 
         await strategy.run()
 
         assert strategy._running is False
 
-    @pytest.mark.asyncio
-    async def test_initialize_grid_orders_once_trigger_price_equals_last_price(self, setup_strategy):
-        create_strategy, _, _, _, order_manager, _, _, _, _ = setup_strategy
-        strategy = create_strategy()
-
-        order_manager.perform_initial_purchase = AsyncMock()
-        order_manager.initialize_grid_orders = AsyncMock()
-
-        result = await strategy._initialize_grid_orders_once(
-            current_price=15000,
-            trigger_price=15000,
-            grid_orders_initialized=False,
-            last_price=15000,
-        )
-
-        assert result is True
-        order_manager.perform_initial_purchase.assert_called_once_with(15000)
-        order_manager.initialize_grid_orders.assert_called_once_with(15000)
-
-    @pytest.mark.asyncio
-    async def test_run_live_trading_stop_condition(self, setup_strategy):
-        create_strategy, _, exchange_service, _, _, _, _, _, _ = setup_strategy
-        strategy = create_strategy(TradingMode.LIVE)
-
-        async def stop_strategy(*args, **kwargs):
-            strategy._running = False
-
-        exchange_service.listen_to_ticker_updates = AsyncMock(side_effect=stop_strategy)
-
-        await strategy.run()
-
-        assert not strategy._running
-        exchange_service.listen_to_ticker_updates.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_on_ticker_update_error_handling(self, setup_strategy):
-        create_strategy, _, exchange_service, grid_manager, order_manager, balance_tracker, _, _, _ = setup_strategy
-        strategy = create_strategy(TradingMode.LIVE)
+    async def test_on_ticker_update_error_handling(self, harness):
+        strategy = harness.create_strategy(TradingMode.LIVE)
 
-        grid_manager.get_trigger_price.return_value = 15000
-        balance_tracker.get_total_balance_value.side_effect = Exception("Balance calculation error")
+        harness.grid_manager.get_trigger_price.return_value = 15000
+        harness.balance_tracker.get_total_balance_value.side_effect = Exception("Balance calculation error")
 
         async def simulate_ticker_update():
-            callback = exchange_service.listen_to_ticker_updates.call_args[0][1]
+            callback = harness.exchange_service.listen_to_ticker_updates.call_args[0][1]
             await callback(15100)
 
-        exchange_service.listen_to_ticker_updates = AsyncMock(side_effect=simulate_ticker_update)
+        harness.exchange_service.listen_to_ticker_updates.side_effect = simulate_ticker_update
 
         await strategy.run()
 
-        exchange_service.listen_to_ticker_updates.assert_called_once()
+        harness.exchange_service.listen_to_ticker_updates.assert_called_once()
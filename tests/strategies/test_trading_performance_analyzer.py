@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pandas as pd
 import pytest
@@ -47,11 +47,36 @@ class TestPerformanceAnalyzer:
         max_drawdown = analyzer._calculate_drawdown(mock_account_data)
         assert max_drawdown == pytest.approx(9.52, rel=1e-3)
 
+    def test_calculate_drawdown_with_lookback(self, setup_performance_analyzer):
+        analyzer, _, _ = setup_performance_analyzer
+        data = pd.DataFrame({"account_value": [10000, 10500, 9800, 9700, 9900]})
+
+        assert analyzer._calculate_drawdown(data) == pytest.approx(7.62, rel=1e-3)
+        assert analyzer._calculate_drawdown(data, lookback=2) == pytest.approx(6.67, rel=1e-3)
+        assert analyzer._calculate_drawdown(data, lookback=1) == 0.0
+
+        with pytest.raises(ValueError, match="at least one period"):
+            analyzer._calculate_drawdown(data, lookback=0)
+
     def test_calculate_runup(self, setup_performance_analyzer, mock_account_data):
         analyzer, _, _ = setup_performance_analyzer
         max_runup = analyzer._calculate_runup(mock_account_data)
         assert max_runup == 5.0  # Expected max runup from 10000 to 10500 (5%)
 
+    def test_calculate_drawdown_and_runup_skips_missing_account_values(
+        self,
+        setup_performance_analyzer,
+        mock_account_data,
+    ):
+        analyzer, _, _ = setup_performance_analyzer
+        data = mock_account_data.copy()
+        data.loc[data.index[1], "account_value"] = float("nan")
+
+        max_drawdown, max_runup = analyzer._calculate_drawdown_and_runup(data)
+
+        assert max_drawdown == pytest.approx(9.52, rel=1e-3)
+        assert max_runup == 5.0
+
     def test_calculate_trading_gains(self, setup_performance_analyzer):
         analyzer, _, order_book = setup_performance_analyzer
 
@@ -93,6 +118,26 @@ class TestPerformanceAnalyzer:
         sharpe_ratio = analyzer._calculate_sharpe_ratio(data)
         assert sharpe_ratio == 0.0  # Expected Sharpe ratio to be 0 when there is no volatility
 
+    def test_calculate_sharpe_ratio_single_return(self, setup_performance_analyzer):
+        analyzer, _, _ = setup_performance_analyzer
+        data = pd.DataFrame(
+            {"account_value": [10000, 10250]},
+            index=pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        )
+        sharpe_ratio = analyzer._calculate_sharpe_ratio(data)
+        assert pd.isna(sharpe_ratio)  # Sample std is undefined for a single return
+
+    def test_ratios_with_precomputed_excess_returns(self, setup_performance_analyzer):
+        analyzer, _, _ = setup_performance_analyzer
+        data = pd.DataFrame(
+            {"account_value": [10000, 10250, 9900, 10300, 9700]},
+            index=pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]),
+        )
+        excess_returns = analyzer._calculate_excess_returns(data)
+
+        assert analyzer._calculate_sharpe_ratio(data, excess_returns) == analyzer._calculate_sharpe_ratio(data)
+        assert analyzer._calculate_sortino_ratio(data, excess_returns) == analyzer._calculate_sortino_ratio(data)
+
     def test_get_formatted_orders(self, setup_performance_analyzer):
         analyzer, _, order_book = setup_performance_analyzer
 
@@ -152,6 +197,43 @@ class TestPerformanceAnalyzer:
             "-0.42%",
         ]
 
+    def test_get_formatted_orders_without_grid_level_or_average(self, setup_performance_analyzer):
+        analyzer, _, order_book = setup_performance_analyzer
+        grid_level = Mock(spec=GridLevel, price=1000.0)
+
+        non_grid_order = Mock(
+            spec=Order,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            status=OrderStatus.CLOSED,
+            price=1100.0,
+            average=1100.0,
+            filled=0.5,
+            format_last_trade_timestamp=Mock(return_value="2024-01-02T00:00:00Z"),
+            is_filled=Mock(return_value=True),
+        )
+        order_without_average = Mock(
+            spec=Order,
+            side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            status=OrderStatus.CLOSED,
+            price=1000.0,
+            average=None,
+            filled=0.5,
+            format_last_trade_timestamp=Mock(return_value="2024-01-01T00:00:00Z"),
+            is_filled=Mock(return_value=True),
+        )
+
+        order_book.get_buy_orders_with_grid.return_value = [(order_without_average, grid_level)]
+        order_book.get_sell_orders_with_grid.return_value = [(non_grid_order, None)]
+
+        formatted_orders = analyzer.get_formatted_orders()
+
+        assert formatted_orders == [
+            ["BUY", "LIMIT", "CLOSED", 1000.0, 0.5, "2024-01-01T00:00:00Z", 1000.0, "N/A"],
+            ["SELL", "MARKET", "CLOSED", 1100.0, 0.5, "2024-01-02T00:00:00Z", "N/A", "N/A"],
+        ]
+
     def test_get_formatted_orders_empty(self, setup_performance_analyzer):
         analyzer, _, order_book = setup_performance_analyzer
         order_book.get_buy_orders_with_grid.return_value = []
@@ -160,6 +242,19 @@ class TestPerformanceAnalyzer:
         formatted_orders = analyzer.get_formatted_orders()
         assert formatted_orders == []
 
+    def test_get_formatted_orders_without_filled_orders(self, setup_performance_analyzer):
+        analyzer, _, order_book = setup_performance_analyzer
+        open_order = Mock(spec=Order)
+        open_order.is_filled.return_value = False
+        order_book.get_buy_orders_with_grid.return_value = [(open_order, Mock(spec=GridLevel))]
+        order_book.get_sell_orders_with_grid.return_value = []
+
+        with patch.object(analyzer, "_calculate_slippages") as calculate_slippages:
+            formatted_orders = analyzer.get_formatted_orders()
+
+        assert formatted_orders == []
+        calculate_slippages.assert_not_called()
+
     def test_generate_performance_summary(self, setup_performance_analyzer, mock_account_data, caplog):
         analyzer, config_manager, order_book = setup_performance_analyzer
 
@@ -230,6 +325,7 @@ class TestPerformanceAnalyzer:
             final_fiat_balance + final_crypto_balance * final_crypto_price,
         )
         assert performance_summary["ROI"] == f"{expected_roi:.2f}%"
+        assert performance_summary["ROI_raw"] == expected_roi
         assert performance_summary["Grid Trading Gains"] == "197.50"  # Adjusted for mocked fees
         assert performance_summary["Total Fees"] == f"{total_fees:.2f}"
         assert (
@@ -246,6 +342,8 @@ class TestPerformanceAnalyzer:
         )
         assert performance_summary["Number of Buy Trades"] == 1
         assert performance_summary["Number of Sell Trades"] == 1
+        order_book.get_all_buy_orders.assert_called_once()
+        order_book.get_all_sell_orders.assert_called_once()
         assert "Sharpe Ratio" in performance_summary
         assert "Sortino Ratio" in performance_summary
 
@@ -276,6 +374,37 @@ class TestPerformanceAnalyzer:
         log_messages = [record.message for record in caplog.records]
         assert any("Formatted Orders" in message for message in log_messages)
         assert any("Performance Summary" in message for message in log_messages)
+        summary_log = next(message for message in log_messages if "Performance Summary" in message)
+        assert "ROI_raw" not in summary_log
+
+    def test_generate_performance_summary_skips_tables_when_info_disabled(
+        self,
+        setup_performance_analyzer,
+        mock_account_data,
+        caplog,
+    ):
+        analyzer, _, order_book = setup_performance_analyzer
+        order_book.get_all_buy_orders.return_value = []
+        order_book.get_all_sell_orders.return_value = []
+        order_book.get_buy_orders_with_grid.return_value = []
+        order_book.get_sell_orders_with_grid.return_value = []
+
+        with (
+            caplog.at_level(logging.WARNING, logger=analyzer.logger.name),
+            patch("strategies.trading_performance_analyzer.tabulate") as mock_tabulate,
+        ):
+            performance_summary, formatted_orders = analyzer.generate_performance_summary(
+                mock_account_data,
+                100,
+                5000,
+                0.5,
+                95,
+                10,
+            )
+
+        mock_tabulate.assert_not_called()
+        assert performance_summary["Final Balance (Fiat)"] == "5047.50"
+        assert formatted_orders == []
 
     def test_calculate_sortino_ratio(self, setup_performance_analyzer, mock_account_data):
         analyzer, _, _ = setup_performance_analyzer